@@ -8,7 +8,7 @@ import sys
 
 sys.path.append(str(Path(__file__).resolve().parents[1]))
 
-from scripts import run_part1_classic, run_part2_embeddings, run_part3_topic_tree, run_all
+from scripts import run_part1_classic, run_part2_embeddings, run_part3_topic_tree, run_reduction_benchmark, run_sweep, run_encoder_check, route_documents, run_all
 from src.docs_autogen import regenerate_docs
 
 
@@ -19,6 +19,13 @@ def get_parser() -> argparse.ArgumentParser:
     parser.add_argument("--test-size", type=float, default=0.2, help="Test split proportion")
     parser.add_argument("--vectorizer", choices=["bow", "tfidf"], default="tfidf", help="Text vectorizer for part1")
     parser.add_argument("--st-model", default="all-MiniLM-L6-v2", help="SentenceTransformer model for parts 2/3")
+    parser.add_argument("--reducer", choices=["none", "pca", "gaussian_rp", "sparse_rp", "svd"], default="none", help="Dimensionality reduction stage for all parts")
+    parser.add_argument("--reduce-dim", type=int, default=128, help="Output dimension of the reduction stage")
+    parser.add_argument("--dedup", choices=["none", "exact", "near"], default="none", help="Duplicate collapsing before part3 encoding and clustering")
+    parser.add_argument("--encoder-backend", choices=["torch", "torch-int8", "onnx"], default="torch", help="Sentence encoder backend for parts 2/3")
+    parser.add_argument("--encoder-threads", type=int, default=None, help="CPU threads for the encoder (default: library default)")
+    parser.add_argument("--tree-max-top", type=int, default=50, help="Top-level clusters shown in the printed/report tree view")
+    parser.add_argument("--tree-max-children", type=int, default=20, help="Subclusters shown per parent in the printed/report tree view")
     parser.add_argument("--outputs-dir", default="outputs", help="Directory for output artifacts")
     return parser
 
@@ -34,6 +41,10 @@ def run(args):
         "run_part1_classic.py": run_part1_classic.get_parser(),
         "run_part2_embeddings.py": run_part2_embeddings.get_parser(),
         "run_part3_topic_tree.py": run_part3_topic_tree.get_parser(),
+        "run_reduction_benchmark.py": run_reduction_benchmark.get_parser(),
+        "run_sweep.py": run_sweep.get_parser(),
+        "run_encoder_check.py": run_encoder_check.get_parser(),
+        "route_documents.py": route_documents.get_parser(),
         "run_all.py": run_all.get_parser(),
         "demo.py": get_parser(),
     }
@@ -50,7 +61,8 @@ def run(args):
     part3 = run_part3_topic_tree.run(args)
 
     narrate("Reporting", "Writing outputs/DEMO_REPORT.md with tables, comparisons, plots, and topic tree excerpt.")
-    from src.reporting import write_demo_report
+    from src.reporting import wait_for_figures, write_demo_report
+    from src.topic_tree import iter_tree_jsonl, iter_tree_lines
 
     out_dir = Path(args.outputs_dir)
     write_demo_report(
@@ -66,8 +78,12 @@ def run(args):
         p2_metrics=p2_metrics,
         chosen_k=part3["chosen_k"],
         top_clusters=part3["top_clusters"],
-        tree_text=part3["tree_text"],
+        tree_lines=iter_tree_lines(
+            iter_tree_jsonl(out_dir / "topic_tree.jsonl"), args.tree_max_top, args.tree_max_children
+        ),
+        dedup_stats=part3["dedup_stats"],
     )
+    wait_for_figures()
     narrate("Done", "Demo complete. Open outputs/DEMO_REPORT.md for recording-ready narrative.")
 
 
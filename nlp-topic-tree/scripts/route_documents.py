@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+import sys
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+
+def get_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Route new documents through the saved topic tree index")
+    parser.add_argument("--input", required=True, help="Text file with one document per line")
+    parser.add_argument("--output", default=None, help="JSONL output path (default: <outputs-dir>/routed.jsonl)")
+    parser.add_argument("--top-n", type=int, default=1, help="Number of scored root-to-leaf paths per document")
+    parser.add_argument("--batch-size", type=int, default=4_096, help="Documents encoded and routed per batch")
+    parser.add_argument("--encoder-threads", type=int, default=None, help="CPU threads for the encoder (default: library default)")
+    parser.add_argument("--outputs-dir", default="outputs", help="Directory holding topic_index.npz/.json from part3")
+    return parser
+
+
+def _batches(path: Path, batch_size: int):
+    batch = []
+    with path.open(encoding="utf-8") as f:
+        for line in f:
+            batch.append(line.rstrip("\n"))
+            if len(batch) == batch_size:
+                yield batch
+                batch = []
+    if batch:
+        yield batch
+
+
+def run(args):
+    from src.features import encode_texts
+    from src.reduction import load_reducer, transform_in_chunks
+    from src.topic_index import CentroidIndex
+
+    out_dir = Path(args.outputs_dir)
+    index = CentroidIndex.load(out_dir / "topic_index")
+    reducer = load_reducer(out_dir / index.meta["reducer"]) if index.meta.get("reducer") else None
+    labels = index.meta.get("labels", [])
+    output = Path(args.output) if args.output else out_dir / "routed.jsonl"
+
+    n_docs = 0
+    with output.open("w", encoding="utf-8") as f:
+        for batch in _batches(Path(args.input), args.batch_size):
+            emb = encode_texts(
+                batch,
+                index.meta["st_model"],
+                backend=index.meta.get("encoder_backend", "torch"),
+                threads=args.encoder_threads,
+            )
+            emb = transform_in_chunks(reducer, emb)
+            paths, scores = index.route(emb, top_n=args.top_n)
+            ids = index.path_ids(paths)
+            for i in range(len(batch)):
+                routes = []
+                for b in range(paths.shape[1]):
+                    levels = [level for level in range(index.depth) if paths[i, b, level] >= 0]
+                    routes.append(
+                        {
+                            "path": [int(ids[i, b, level]) for level in levels],
+                            "labels": [labels[level][paths[i, b, level]] for level in levels if level < len(labels)],
+                            "score": float(scores[i, b]),
+                        }
+                    )
+                f.write(json.dumps({"doc": n_docs + i, "routes": routes}) + "\n")
+            n_docs += len(batch)
+
+    print(f"Routed {n_docs} documents -> {output}")
+    return output
+
+
+if __name__ == "__main__":
+    parser = get_parser()
+    run(parser.parse_args())
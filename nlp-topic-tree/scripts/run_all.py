@@ -7,7 +7,7 @@ import sys
 
 sys.path.append(str(Path(__file__).resolve().parents[1]))
 
-from scripts import run_part1_classic, run_part2_embeddings, run_part3_topic_tree
+from scripts import run_part1_classic, run_part2_embeddings, run_part3_topic_tree, run_reduction_benchmark, run_sweep, run_encoder_check, route_documents
 from src.docs_autogen import regenerate_docs
 
 
@@ -18,6 +18,13 @@ def get_parser() -> argparse.ArgumentParser:
     parser.add_argument("--test-size", type=float, default=0.2, help="Test split proportion")
     parser.add_argument("--vectorizer", choices=["bow", "tfidf"], default="tfidf", help="Text vectorizer for part1")
     parser.add_argument("--st-model", default="all-MiniLM-L6-v2", help="SentenceTransformer model for parts 2/3")
+    parser.add_argument("--reducer", choices=["none", "pca", "gaussian_rp", "sparse_rp", "svd"], default="none", help="Dimensionality reduction stage for all parts")
+    parser.add_argument("--reduce-dim", type=int, default=128, help="Output dimension of the reduction stage")
+    parser.add_argument("--dedup", choices=["none", "exact", "near"], default="none", help="Duplicate collapsing before part3 encoding and clustering")
+    parser.add_argument("--encoder-backend", choices=["torch", "torch-int8", "onnx"], default="torch", help="Sentence encoder backend for parts 2/3")
+    parser.add_argument("--encoder-threads", type=int, default=None, help="CPU threads for the encoder (default: library default)")
+    parser.add_argument("--tree-max-top", type=int, default=50, help="Top-level clusters shown in the printed tree view")
+    parser.add_argument("--tree-max-children", type=int, default=20, help="Subclusters shown per parent in the printed tree view")
     parser.add_argument("--outputs-dir", default="outputs", help="Directory for output artifacts")
     return parser
 
@@ -30,6 +37,10 @@ def run(args):
         "run_part1_classic.py": run_part1_classic.get_parser(),
         "run_part2_embeddings.py": run_part2_embeddings.get_parser(),
         "run_part3_topic_tree.py": run_part3_topic_tree.get_parser(),
+        "run_reduction_benchmark.py": run_reduction_benchmark.get_parser(),
+        "run_sweep.py": run_sweep.get_parser(),
+        "run_encoder_check.py": run_encoder_check.get_parser(),
+        "route_documents.py": route_documents.get_parser(),
         "run_all.py": get_parser(),
         "demo.py": demo.get_parser(),
     }
@@ -39,6 +50,10 @@ def run(args):
     run_part2_embeddings.run(args)
     run_part3_topic_tree.run(args)
 
+    from src.reporting import wait_for_figures
+
+    wait_for_figures()
+
 
 if __name__ == "__main__":
     parser = get_parser()
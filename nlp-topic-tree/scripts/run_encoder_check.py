@@ -0,0 +1,126 @@
+#!/usr/bin/env python
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+import sys
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+
+def get_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Encoder check: compare backends against float32 torch embeddings")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    parser.add_argument("--n-samples", type=int, default=10_000, help="Number of sampled documents")
+    parser.add_argument("--test-size", type=float, default=0.2, help="Test split proportion")
+    parser.add_argument("--st-model", default="all-MiniLM-L6-v2", help="SentenceTransformer model")
+    parser.add_argument(
+        "--backends",
+        nargs="+",
+        choices=["torch-int8", "onnx"],
+        default=["torch-int8"],
+        help="Candidate backends to compare with the float32 torch reference",
+    )
+    parser.add_argument("--warmup", type=int, default=256, help="Documents encoded before timing each backend")
+    parser.add_argument("--encoder-threads", type=int, default=None, help="CPU threads for the encoder (default: library default)")
+    parser.add_argument("--outputs-dir", default="outputs", help="Directory for output artifacts")
+    return parser
+
+
+def _encode_and_score(texts, split, data, args, backend: str):
+    import time
+
+    from src.encoders import get_encoder
+    from src.eval import compare_models
+    from src.features import encode_texts
+    from src.models import embedding_models
+
+    start = time.perf_counter()
+    encoder = get_encoder(args.st_model, backend=backend, threads=args.encoder_threads)
+    load_s = time.perf_counter() - start
+    encoder.encode(list(texts[: args.warmup]))
+
+    start = time.perf_counter()
+    embeddings = encode_texts(texts, args.st_model, backend=backend, threads=args.encoder_threads)
+    encode_s = time.perf_counter() - start
+    metrics, _, best = compare_models(
+        embedding_models(seed=args.seed),
+        embeddings[split.x_train],
+        split.y_train,
+        embeddings[split.x_test],
+        split.y_test,
+        data.target_names,
+    )
+    return embeddings, load_s, encode_s, metrics, best[0]
+
+
+def run(args):
+    import numpy as np
+
+    from src.config import ensure_outputs_dir
+    from src.data import load_dataset, stratified_split
+    from src.encoders import cosine_agreement
+    from src.reporting import markdown_table
+
+    out_dir = ensure_outputs_dir(args.outputs_dir)
+    data = load_dataset(n_samples=args.n_samples, seed=args.seed)
+    split = stratified_split(np.arange(len(data.y)), data.y, test_size=args.test_size, seed=args.seed)
+
+    reference, ref_load_s, ref_s, ref_metrics, ref_best = _encode_and_score(data.texts, split, data, args, "torch")
+    results = [
+        {
+            "backend": "torch",
+            "load_s": ref_load_s,
+            "encode_s": ref_s,
+            "speedup": 1.0,
+            "cosine": cosine_agreement(reference, reference),
+            "best": ref_best,
+            "metrics": ref_metrics,
+            "macro_f1_delta": {name: 0.0 for name in ref_metrics},
+            "best_macro_f1_delta": 0.0,
+        }
+    ]
+    for backend in args.backends:
+        embeddings, load_s, encode_s, metrics, best = _encode_and_score(data.texts, split, data, args, backend)
+        results.append(
+            {
+                "backend": backend,
+                "load_s": load_s,
+                "encode_s": encode_s,
+                "speedup": ref_s / encode_s if encode_s else 0.0,
+                "cosine": cosine_agreement(reference, embeddings),
+                "best": best,
+                "metrics": metrics,
+                "macro_f1_delta": {name: metrics[name]["macro_f1"] - ref_metrics[name]["macro_f1"] for name in ref_metrics},
+                "best_macro_f1_delta": metrics[best]["macro_f1"] - ref_metrics[ref_best]["macro_f1"],
+            }
+        )
+
+    (out_dir / "encoder_check.json").write_text(json.dumps(results, indent=2), encoding="utf-8")
+    rows = [
+        [
+            r["backend"],
+            f"{r['load_s']:.1f}",
+            f"{r['encode_s']:.1f}",
+            f"{r['speedup']:.2f}x",
+            f"{r['cosine']['mean']:.4f}",
+            f"{r['cosine']['p05']:.4f}",
+            f"{r['cosine']['min']:.4f}",
+            f"{r['best']} ({r['metrics'][r['best']]['macro_f1']:.4f})",
+            *(f"{r['macro_f1_delta'][name]:+.4f}" for name in ref_metrics),
+            f"{r['best_macro_f1_delta']:+.4f}",
+        ]
+        for r in results
+    ]
+    headers = ["Backend", "Load s", "Encode s", "Speedup", "Cosine mean", "Cosine p05", "Cosine min", "Best (Macro-F1)"]
+    headers += [f"{name} Macro-F1 delta" for name in ref_metrics] + ["Best Macro-F1 delta"]
+    table = markdown_table(headers, rows)
+    (out_dir / "encoder_check.md").write_text(f"# Encoder Check\n\n{table}\n", encoding="utf-8")
+    print(table)
+    return results
+
+
+if __name__ == "__main__":
+    parser = get_parser()
+    run(parser.parse_args())
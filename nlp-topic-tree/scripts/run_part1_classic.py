@@ -15,6 +15,13 @@ def get_parser() -> argparse.ArgumentParser:
     parser.add_argument("--n-samples", type=int, default=10_000, help="Number of sampled documents")
     parser.add_argument("--test-size", type=float, default=0.2, help="Test split proportion")
     parser.add_argument("--vectorizer", choices=["bow", "tfidf"], default="tfidf", help="Text vectorizer")
+    parser.add_argument("--reducer", choices=["none", "pca", "gaussian_rp", "sparse_rp", "svd"], default="none", help="Dimensionality reduction after the vectorizer (pca falls back to svd)")
+    parser.add_argument("--reduce-dim", type=int, default=128, help="Output dimension of the reduction stage")
+    parser.add_argument("--dedup", choices=["none", "exact", "near"], default="none", help="Unused; kept for uniform CLI")
+    parser.add_argument("--encoder-backend", choices=["torch", "torch-int8", "onnx"], default="torch", help="Unused; kept for uniform CLI")
+    parser.add_argument("--encoder-threads", type=int, default=None, help="Unused; kept for uniform CLI")
+    parser.add_argument("--tree-max-top", type=int, default=50, help="Unused; kept for uniform CLI")
+    parser.add_argument("--tree-max-children", type=int, default=20, help="Unused; kept for uniform CLI")
     parser.add_argument("--outputs-dir", default="outputs", help="Directory for output artifacts")
     parser.add_argument("--st-model", default="all-MiniLM-L6-v2", help="Unused; kept for uniform CLI")
     return parser
@@ -23,30 +30,35 @@ def get_parser() -> argparse.ArgumentParser:
 def run(args):
     from src.config import ensure_outputs_dir
     from src.data import load_dataset, stratified_split
-    from src.eval import evaluate_predictions
-    from src.models import classic_model_pipelines
-    from src.reporting import plot_confusion_matrix
+    from src.eval import compare_models
+    from src.models import classic_model_pipelines, classic_reduced_features, embedding_models
+    from src.reduction import save_reducer
+    from src.reporting import plot_confusion_matrix, render_figure
 
     out_dir = ensure_outputs_dir(args.outputs_dir)
     data = load_dataset(n_samples=args.n_samples, seed=args.seed)
     split = stratified_split(data.texts, data.y, test_size=args.test_size, seed=args.seed)
 
-    models = classic_model_pipelines(args.vectorizer, seed=args.seed)
-    metrics, confusions = {}, {}
-    best = None
-
-    for name, pipe in models.items():
-        pipe.fit(split.x_train, split.y_train)
-        pred = pipe.predict(split.x_test)
-        ev = evaluate_predictions(split.y_test, pred, data.target_names)
-        metrics[name] = {"accuracy": ev["accuracy"], "macro_f1": ev["macro_f1"]}
-        confusions[name] = ev["top_confusions"]
-        if best is None or ev["macro_f1"] > best[1]["macro_f1"]:
-            best = (name, ev)
+    if args.reducer == "none":
+        models = classic_model_pipelines(args.vectorizer, seed=args.seed)
+        x_train, x_test = split.x_train, split.x_test
+    else:
+        vectorizer, reducer, x_train, x_test = classic_reduced_features(
+            args.vectorizer, split.x_train, split.x_test, args.reducer, args.reduce_dim, seed=args.seed
+        )
+        save_reducer(out_dir / "vectorizer_part1.joblib", vectorizer)
+        save_reducer(out_dir / "reducer_part1.joblib", reducer)
+        models = embedding_models(seed=args.seed)
+    metrics, confusions, best = compare_models(models, x_train, split.y_train, x_test, split.y_test, data.target_names)
 
     (out_dir / "metrics_part1.json").write_text(json.dumps(metrics, indent=2), encoding="utf-8")
     (out_dir / "confusions_part1.json").write_text(json.dumps(confusions, indent=2), encoding="utf-8")
-    plot_confusion_matrix(best[1]["confusion_matrix"], out_dir / "confusion_matrix_part1.png", f"Part1 best={best[0]}")
+    render_figure(
+        plot_confusion_matrix,
+        out_dir / "confusion_matrix_part1.png",
+        cm=best[1]["confusion_matrix"],
+        title=f"Part1 best={best[0]}",
+    )
     return metrics
 
 
@@ -16,6 +16,13 @@ def get_parser() -> argparse.ArgumentParser:
     parser.add_argument("--test-size", type=float, default=0.2, help="Test split proportion")
     parser.add_argument("--vectorizer", choices=["bow", "tfidf"], default="tfidf", help="Unused; kept for uniform CLI")
     parser.add_argument("--st-model", default="all-MiniLM-L6-v2", help="SentenceTransformer model")
+    parser.add_argument("--reducer", choices=["none", "pca", "gaussian_rp", "sparse_rp", "svd"], default="none", help="Dimensionality reduction applied to embeddings before the classifiers")
+    parser.add_argument("--reduce-dim", type=int, default=128, help="Output dimension of the reduction stage")
+    parser.add_argument("--dedup", choices=["none", "exact", "near"], default="none", help="Unused; kept for uniform CLI")
+    parser.add_argument("--encoder-backend", choices=["torch", "torch-int8", "onnx"], default="torch", help="Sentence encoder backend")
+    parser.add_argument("--encoder-threads", type=int, default=None, help="CPU threads for the encoder (default: library default)")
+    parser.add_argument("--tree-max-top", type=int, default=50, help="Unused; kept for uniform CLI")
+    parser.add_argument("--tree-max-children", type=int, default=20, help="Unused; kept for uniform CLI")
     parser.add_argument("--outputs-dir", default="outputs", help="Directory for output artifacts")
     return parser
 
@@ -23,34 +30,36 @@ def get_parser() -> argparse.ArgumentParser:
 def run(args):
     from src.config import ensure_outputs_dir
     from src.data import load_dataset, stratified_split
-    from src.eval import evaluate_predictions
+    from src.eval import compare_models
     from src.features import encode_texts
     from src.models import embedding_models
-    from src.reporting import plot_confusion_matrix
+    from src.reduction import fit_reducer, save_reducer, transform_in_chunks
+    from src.reporting import plot_confusion_matrix, render_figure
 
     out_dir = ensure_outputs_dir(args.outputs_dir)
     data = load_dataset(n_samples=args.n_samples, seed=args.seed)
     split = stratified_split(data.texts, data.y, test_size=args.test_size, seed=args.seed)
 
-    x_train = encode_texts(split.x_train, args.st_model)
-    x_test = encode_texts(split.x_test, args.st_model)
+    x_train = encode_texts(split.x_train, args.st_model, backend=args.encoder_backend, threads=args.encoder_threads)
+    x_test = encode_texts(split.x_test, args.st_model, backend=args.encoder_backend, threads=args.encoder_threads)
+
+    reducer = fit_reducer(x_train, args.reducer, args.reduce_dim, seed=args.seed)
+    if reducer is not None:
+        save_reducer(out_dir / "reducer_part2.joblib", reducer)
+        x_train = transform_in_chunks(reducer, x_train)
+        x_test = transform_in_chunks(reducer, x_test)
 
     models = embedding_models(seed=args.seed)
-    metrics, confusions = {}, {}
-    best = None
-
-    for name, model in models.items():
-        model.fit(x_train, split.y_train)
-        pred = model.predict(x_test)
-        ev = evaluate_predictions(split.y_test, pred, data.target_names)
-        metrics[name] = {"accuracy": ev["accuracy"], "macro_f1": ev["macro_f1"]}
-        confusions[name] = ev["top_confusions"]
-        if best is None or ev["macro_f1"] > best[1]["macro_f1"]:
-            best = (name, ev)
+    metrics, confusions, best = compare_models(models, x_train, split.y_train, x_test, split.y_test, data.target_names)
 
     (out_dir / "metrics_part2.json").write_text(json.dumps(metrics, indent=2), encoding="utf-8")
     (out_dir / "confusions_part2.json").write_text(json.dumps(confusions, indent=2), encoding="utf-8")
-    plot_confusion_matrix(best[1]["confusion_matrix"], out_dir / "confusion_matrix_part2.png", f"Part2 best={best[0]}")
+    render_figure(
+        plot_confusion_matrix,
+        out_dir / "confusion_matrix_part2.png",
+        cm=best[1]["confusion_matrix"],
+        title=f"Part2 best={best[0]}",
+    )
     return metrics
 
 
@@ -16,6 +16,13 @@ def get_parser() -> argparse.ArgumentParser:
     parser.add_argument("--test-size", type=float, default=0.2, help="Unused; present for interface consistency")
     parser.add_argument("--vectorizer", choices=["bow", "tfidf"], default="tfidf", help="Unused; kept for uniform CLI")
     parser.add_argument("--st-model", default="all-MiniLM-L6-v2", help="SentenceTransformer model")
+    parser.add_argument("--reducer", choices=["none", "pca", "gaussian_rp", "sparse_rp", "svd"], default="none", help="Dimensionality reduction applied to embeddings before KMeans")
+    parser.add_argument("--reduce-dim", type=int, default=128, help="Output dimension of the reduction stage")
+    parser.add_argument("--dedup", choices=["none", "exact", "near"], default="none", help="Collapse exact or MinHash near-duplicate documents before encoding and clustering")
+    parser.add_argument("--encoder-backend", choices=["torch", "torch-int8", "onnx"], default="torch", help="Sentence encoder backend")
+    parser.add_argument("--encoder-threads", type=int, default=None, help="CPU threads for the encoder (default: library default)")
+    parser.add_argument("--tree-max-top", type=int, default=50, help="Top-level clusters shown in the printed/report tree view (full tree is always exported)")
+    parser.add_argument("--tree-max-children", type=int, default=20, help="Subclusters shown per parent in the printed/report tree view")
     parser.add_argument("--outputs-dir", default="outputs", help="Directory for output artifacts")
     return parser
 
@@ -27,18 +34,37 @@ def run(args):
     from src.clustering import elbow_search, nearest_docs_to_centroid, save_elbow
     from src.config import ensure_outputs_dir
     from src.data import load_dataset
+    from src.dedup import dedup_texts, save_dedup_stats
     from src.features import encode_texts
     from src.labeling import get_labeler
-    from src.reporting import plot_elbow
-    from src.topic_tree import render_topic_tree
+    from src.reduction import fit_reducer, save_reducer, transform_in_chunks
+    from src.reporting import plot_elbow, render_figure
+    from src.topic_index import build_topic_index
+    from src.topic_tree import export_topic_tree, render_topic_tree
 
     out_dir = ensure_outputs_dir(args.outputs_dir)
     data = load_dataset(n_samples=args.n_samples, seed=args.seed)
-    embeddings = encode_texts(data.texts, args.st_model)
 
-    elbow = elbow_search(embeddings, ks=range(2, 10), seed=args.seed)
+    texts = data.texts
+    weights = np.ones(len(texts), dtype=np.int64)
+    dedup = None
+    if args.dedup != "none":
+        dedup = dedup_texts(data.texts, mode=args.dedup, seed=args.seed)
+        save_dedup_stats(out_dir / "dedup_part3.json", dedup)
+        texts = data.texts[dedup.representatives]
+        weights = dedup.weights
+        print(f"Dedup: encoding {dedup.stats['n_unique']} of {dedup.stats['n_docs']} documents")
+
+    embeddings = encode_texts(texts, args.st_model, backend=args.encoder_backend, threads=args.encoder_threads)
+
+    reducer = fit_reducer(embeddings, args.reducer, args.reduce_dim, seed=args.seed)
+    if reducer is not None:
+        save_reducer(out_dir / "reducer_part3.joblib", reducer)
+        embeddings = transform_in_chunks(reducer, embeddings)
+
+    elbow = elbow_search(embeddings, ks=range(2, 10), seed=args.seed, sample_weight=weights)
     save_elbow(out_dir / "elbow.json", elbow)
-    plot_elbow(elbow["ks"], elbow["inertias"], elbow["chosen_k"], out_dir / "elbow.png")
+    render_figure(plot_elbow, out_dir / "elbow.png", ks=elbow["ks"], inertias=elbow["inertias"], chosen_k=elbow["chosen_k"])
 
     km = elbow["model"]
     labels = km.labels_
@@ -48,51 +74,83 @@ def run(args):
     for cid in range(elbow["chosen_k"]):
         idx = np.where(labels == cid)[0]
         nearest = nearest_docs_to_centroid(embeddings, idx, km.cluster_centers_[cid], top_n=8)
-        snippets = [data.texts[i][:280].replace("\n", " ") for i in nearest]
+        snippets = [texts.snippet(i, 280).replace("\n", " ") for i in nearest]
         lbl = labeler.label(snippets)
         top_clusters.append(
             {
                 "cluster_id": cid,
-                "size": int(len(idx)),
+                "size": int(weights[idx].sum()),
                 "representative_snippets": snippets,
                 "label": lbl.get("label", "Unknown"),
                 "rationale": lbl.get("rationale", ""),
             }
         )
 
-    (out_dir / "clusters_top_level.json").write_text(json.dumps(top_clusters, indent=2), encoding="utf-8")
+    doc_labels = labels if dedup is None else dedup.fan_out(labels)
+    (out_dir / "cluster_assignments.json").write_text(json.dumps(doc_labels.tolist()), encoding="utf-8")
+    with (out_dir / "clusters_top_level.json").open("w", encoding="utf-8") as f:
+        json.dump(top_clusters, f)
 
     two_largest = sorted(top_clusters, key=lambda x: x["size"], reverse=True)[:2]
     sub_clusters = []
+    sub_models = {}
     for cluster in two_largest:
         cid = cluster["cluster_id"]
         idx = np.where(labels == cid)[0]
         sub_km = KMeans(n_clusters=3, random_state=args.seed, n_init=10)
-        sub_km.fit(embeddings[idx])
+        sub_km.fit(embeddings[idx], sample_weight=weights[idx])
+        sub_models[cid] = sub_km
         sub_labels = sub_km.labels_
         for sub_id in range(3):
             sub_idx_local = np.where(sub_labels == sub_id)[0]
             actual_idx = idx[sub_idx_local]
             nearest = nearest_docs_to_centroid(embeddings, actual_idx, sub_km.cluster_centers_[sub_id], top_n=8)
-            snippets = [data.texts[i][:280].replace("\n", " ") for i in nearest]
+            snippets = [texts.snippet(i, 280).replace("\n", " ") for i in nearest]
             lbl = labeler.label(snippets)
             sub_clusters.append(
                 {
                     "parent_cluster_id": int(cid),
                     "subcluster_id": int(sub_id),
-                    "size": int(len(actual_idx)),
+                    "size": int(weights[actual_idx].sum()),
                     "representative_snippets": snippets,
                     "label": lbl.get("label", "Unknown"),
                     "rationale": lbl.get("rationale", ""),
                 }
             )
 
-    (out_dir / "clusters_sub_level.json").write_text(json.dumps(sub_clusters, indent=2), encoding="utf-8")
-
-    tree_text = render_topic_tree(top_clusters, sub_clusters)
-    (out_dir / "topic_tree.txt").write_text(tree_text, encoding="utf-8")
+    with (out_dir / "clusters_sub_level.json").open("w", encoding="utf-8") as f:
+        json.dump(sub_clusters, f)
+
+    index = build_topic_index(
+        km,
+        sub_models,
+        meta={
+            "st_model": args.st_model,
+            "encoder_backend": args.encoder_backend,
+            "reducer": None if reducer is None else "reducer_part3.joblib",
+            "labels": [
+                [c["label"] for c in top_clusters],
+                [s["label"] for s in sorted(sub_clusters, key=lambda s: (s["parent_cluster_id"], s["subcluster_id"]))],
+            ],
+        },
+    )
+    index.save(out_dir / "topic_index")
+
+    sub_rows = np.full(len(labels), -1, dtype=np.int64)
+    for cid, sub_km in sub_models.items():
+        sub_rows[labels == cid] = index.offsets[1][cid] + sub_km.labels_
+    doc_rows = [labels, sub_rows] if dedup is None else [dedup.fan_out(labels), dedup.fan_out(sub_rows)]
+    export_topic_tree(out_dir, top_clusters, sub_clusters, doc_rows=doc_rows)
+
+    tree_text = render_topic_tree(top_clusters, sub_clusters, max_top=args.tree_max_top, max_children=args.tree_max_children)
     print(tree_text)
-    return {"chosen_k": elbow["chosen_k"], "top_clusters": top_clusters, "sub_clusters": sub_clusters, "tree_text": tree_text}
+    return {
+        "chosen_k": elbow["chosen_k"],
+        "top_clusters": top_clusters,
+        "sub_clusters": sub_clusters,
+        "tree_text": tree_text,
+        "dedup_stats": None if dedup is None else dedup.stats,
+    }
 
 
 if __name__ == "__main__":
@@ -0,0 +1,212 @@
+#!/usr/bin/env python
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+import sys
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+
+def get_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Reduction benchmark: speed/quality per output dimension")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    parser.add_argument("--n-samples", type=int, default=10_000, help="Number of sampled documents")
+    parser.add_argument("--test-size", type=float, default=0.2, help="Test split proportion")
+    parser.add_argument("--vectorizer", choices=["bow", "tfidf"], default="tfidf", help="Vectorizer for the part1 section")
+    parser.add_argument("--st-model", default="all-MiniLM-L6-v2", help="SentenceTransformer model")
+    parser.add_argument(
+        "--reducers",
+        nargs="+",
+        choices=["pca", "gaussian_rp", "sparse_rp", "svd"],
+        default=["pca", "gaussian_rp", "sparse_rp", "svd"],
+        help="Reducers to compare against full-width features (pca runs as svd in the part1 section)",
+    )
+    parser.add_argument("--dims", nargs="+", type=int, default=[32, 64, 128, 256], help="Output dimensions to evaluate")
+    parser.add_argument("--k", type=int, default=8, help="KMeans clusters used for the inertia/agreement check")
+    parser.add_argument("--outputs-dir", default="outputs", help="Directory for output artifacts")
+    return parser
+
+
+def _matrix_bytes(x) -> int:
+    if hasattr(x, "indptr"):
+        return int(x.data.nbytes + x.indices.nbytes + x.indptr.nbytes)
+    return int(x.nbytes)
+
+
+def _fit_classifiers(models: dict, x_train, x_test, split, data) -> dict:
+    import time
+
+    from src.eval import evaluate_predictions
+
+    out = {}
+    for name, model in models.items():
+        start = time.perf_counter()
+        model.fit(x_train, split.y_train)
+        fit_s = time.perf_counter() - start
+        ev = evaluate_predictions(split.y_test, model.predict(x_test), data.target_names)
+        out[name] = {"fit_s": fit_s, "macro_f1": ev["macro_f1"]}
+    return out
+
+
+def _reduce(x_train, x_test, reducer_name: str, dim: int, seed: int) -> dict:
+    import time
+    import tracemalloc
+
+    from src.reduction import fit_reducer, transform_in_chunks
+
+    start = time.perf_counter()
+    reducer = fit_reducer(x_train, reducer_name, dim, seed=seed)
+    reduce_fit_s = time.perf_counter() - start
+    start = time.perf_counter()
+    r_train = transform_in_chunks(reducer, x_train)
+    r_test = transform_in_chunks(reducer, x_test)
+    transform_s = time.perf_counter() - start
+
+    # Peak memory comes from a separate, untimed pass: tracemalloc's allocation hooks slow the work down.
+    tracemalloc.start()
+    traced = fit_reducer(x_train, reducer_name, dim, seed=seed)
+    transform_in_chunks(traced, x_train)
+    transform_in_chunks(traced, x_test)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "reducer": reducer_name,
+        "x_train": r_train,
+        "x_test": r_test,
+        "reduce_fit_s": reduce_fit_s,
+        "transform_s": transform_s,
+        "peak_bytes": peak,
+    }
+
+
+def _kmeans(x_all, args, baseline_labels=None) -> tuple[dict, object]:
+    import time
+
+    from sklearn.cluster import KMeans
+    from sklearn.metrics import adjusted_rand_score
+
+    start = time.perf_counter()
+    km = KMeans(n_clusters=args.k, random_state=args.seed, n_init=10).fit(x_all)
+    row = {
+        "kmeans_fit_s": time.perf_counter() - start,
+        "kmeans_inertia": float(km.inertia_),
+        "kmeans_ari_vs_full": 1.0 if baseline_labels is None else float(adjusted_rand_score(baseline_labels, km.labels_)),
+    }
+    return row, km.labels_
+
+
+def _row(r: dict, dim: int, n_bytes: int, classifiers: dict) -> dict:
+    return {
+        "reducer": r["reducer"],
+        "dim": int(dim),
+        "bytes": n_bytes,
+        "reduce_fit_s": r["reduce_fit_s"],
+        "transform_s": r["transform_s"],
+        "peak_bytes": r["peak_bytes"],
+        "classifiers": classifiers,
+    }
+
+
+def _part1_section(split, data, args) -> list[dict]:
+    from src.features import build_vectorizer
+    from src.models import classic_model_pipelines, embedding_models
+    from src.reduction import sparse_reducer_name
+
+    vectorizer = build_vectorizer(args.vectorizer)
+    x_train = vectorizer.fit_transform(split.x_train)
+    x_test = vectorizer.transform(split.x_test)
+
+    full_width = {name: pipe.named_steps["model"] for name, pipe in classic_model_pipelines(args.vectorizer, seed=args.seed).items()}
+    none = {"reducer": "none", "reduce_fit_s": 0.0, "transform_s": 0.0, "peak_bytes": 0}
+    results = [_row(none, x_train.shape[1], _matrix_bytes(x_train), _fit_classifiers(full_width, x_train, x_test, split, data))]
+
+    for reducer_name in dict.fromkeys(sparse_reducer_name(r) for r in args.reducers):
+        for dim in args.dims:
+            if dim >= x_train.shape[1]:
+                continue
+            r = _reduce(x_train, x_test, reducer_name, dim, args.seed)
+            # Reduced features are dense, so the classifiers match the part2 family (MinMax-scaled MNB).
+            classifiers = _fit_classifiers(embedding_models(seed=args.seed), r["x_train"], r["x_test"], split, data)
+            results.append(_row(r, dim, _matrix_bytes(r["x_train"]), classifiers))
+    return results
+
+
+def _embedding_section(split, data, args) -> list[dict]:
+    import numpy as np
+
+    from src.features import encode_texts
+    from src.models import embedding_models
+
+    x_train = encode_texts(split.x_train, args.st_model)
+    x_test = encode_texts(split.x_test, args.st_model)
+    x_all = np.vstack([x_train, x_test])
+
+    none = {"reducer": "none", "reduce_fit_s": 0.0, "transform_s": 0.0, "peak_bytes": 0}
+    classifiers = _fit_classifiers(embedding_models(seed=args.seed), x_train, x_test, split, data)
+    kmeans, baseline_labels = _kmeans(x_all, args)
+    results = [{**_row(none, x_all.shape[1], _matrix_bytes(x_all), classifiers), **kmeans}]
+
+    for reducer_name in args.reducers:
+        for dim in args.dims:
+            if dim >= x_all.shape[1]:
+                continue
+            r = _reduce(x_train, x_test, reducer_name, dim, args.seed)
+            r_all = np.vstack([r["x_train"], r["x_test"]])
+            classifiers = _fit_classifiers(embedding_models(seed=args.seed), r["x_train"], r["x_test"], split, data)
+            kmeans, _ = _kmeans(r_all, args, baseline_labels)
+            results.append({**_row(r, dim, _matrix_bytes(r_all), classifiers), **kmeans})
+    return results
+
+
+def _table(results: list[dict], with_kmeans: bool) -> str:
+    from src.reporting import markdown_table
+
+    headers = ["Reducer", "Dim", "Matrix MiB", "Reduce peak MiB", "Reduce s", "Classifier fit s", "Best Macro-F1"]
+    if with_kmeans:
+        headers += ["KMeans s", "Inertia", "ARI vs full"]
+    rows = []
+    for r in results:
+        row = [
+            r["reducer"],
+            r["dim"],
+            f"{r['bytes'] / 2**20:.1f}",
+            f"{r['peak_bytes'] / 2**20:.1f}",
+            f"{r['reduce_fit_s'] + r['transform_s']:.2f}",
+            f"{sum(c['fit_s'] for c in r['classifiers'].values()):.2f}",
+            f"{max(c['macro_f1'] for c in r['classifiers'].values()):.4f}",
+        ]
+        if with_kmeans:
+            row += [f"{r['kmeans_fit_s']:.2f}", f"{r['kmeans_inertia']:.1f}", f"{r['kmeans_ari_vs_full']:.3f}"]
+        rows.append(row)
+    return markdown_table(headers, rows)
+
+
+def run(args):
+    from src.config import ensure_outputs_dir
+    from src.data import load_dataset, stratified_split
+
+    out_dir = ensure_outputs_dir(args.outputs_dir)
+    data = load_dataset(n_samples=args.n_samples, seed=args.seed)
+    split = stratified_split(data.texts, data.y, test_size=args.test_size, seed=args.seed)
+
+    results = {"part1": _part1_section(split, data, args), "part2": _embedding_section(split, data, args)}
+    (out_dir / "reduction_benchmark.json").write_text(json.dumps(results, indent=2), encoding="utf-8")
+
+    content = f"""# Reduction Benchmark
+
+## Part 1 — {args.vectorizer} features
+{_table(results["part1"], with_kmeans=False)}
+
+## Part 2/3 — Embeddings
+{_table(results["part2"], with_kmeans=True)}
+"""
+    (out_dir / "reduction_benchmark.md").write_text(content, encoding="utf-8")
+    print(content)
+    return results
+
+
+if __name__ == "__main__":
+    parser = get_parser()
+    run(parser.parse_args())
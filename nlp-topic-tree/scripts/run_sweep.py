@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+import sys
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+
+def get_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Sweep a grid of configurations in one process with shared data and encoders")
+    parser.add_argument("--seeds", nargs="+", type=int, default=[42], help="Random seeds to sweep")
+    parser.add_argument("--n-samples", nargs="+", type=int, default=[10_000], help="Sample sizes to sweep")
+    parser.add_argument("--test-size", type=float, default=0.2, help="Test split proportion")
+    parser.add_argument("--vectorizers", nargs="+", choices=["bow", "tfidf"], default=["bow", "tfidf"], help="Part1 vectorizers to sweep")
+    parser.add_argument("--st-models", nargs="+", default=["all-MiniLM-L6-v2"], help="SentenceTransformer models to sweep")
+    parser.add_argument(
+        "--encoder-backends",
+        nargs="+",
+        choices=["torch", "torch-int8", "onnx"],
+        default=["torch"],
+        help="Sentence encoder backends to sweep",
+    )
+    parser.add_argument(
+        "--reducers",
+        nargs="+",
+        choices=["none", "pca", "gaussian_rp", "sparse_rp", "svd"],
+        default=["none"],
+        help="Reduction stages to sweep",
+    )
+    parser.add_argument("--reduce-dim", type=int, default=128, help="Output dimension of the reduction stage")
+    parser.add_argument("--workers", type=int, default=2, help="Concurrent sweep tasks")
+    parser.add_argument("--cores", type=int, default=None, help="Core budget shared by the workers (default: all cores)")
+    parser.add_argument("--outputs-dir", default="outputs", help="Directory for output artifacts")
+    return parser
+
+
+def run(args):
+    from src.config import PipelineConfig, ensure_outputs_dir
+    from src.reporting import markdown_table
+    from src.sweep import expand_grid, run_sweep
+
+    out_dir = ensure_outputs_dir(args.outputs_dir)
+    base = PipelineConfig(test_size=args.test_size, reduce_dim=args.reduce_dim, outputs_dir=args.outputs_dir)
+    configs = expand_grid(
+        base,
+        seed=args.seeds,
+        n_samples=args.n_samples,
+        vectorizer=args.vectorizers,
+        st_model=args.st_models,
+        encoder_backend=args.encoder_backends,
+        reducer=args.reducers,
+    )
+    sweep = run_sweep(configs, workers=args.workers, cores=args.cores)
+    (out_dir / "sweep_results.json").write_text(json.dumps(sweep, indent=2), encoding="utf-8")
+
+    rows = [
+        [
+            r["config"]["seed"],
+            r["config"]["n_samples"],
+            r["config"]["vectorizer"],
+            r["config"]["st_model"],
+            r["config"]["encoder_backend"],
+            r["config"]["reducer"],
+            f"{r['part1_best']} ({r['part1_macro_f1']:.4f})",
+            f"{r['part2_best']} ({r['part2_macro_f1']:.4f})",
+            r["chosen_k"],
+        ]
+        for r in sweep["results"]
+    ]
+    plan_rows = [[name, v["planned"], v["naive"]] for name, v in sweep["plan"].items() if isinstance(v, dict)]
+    content = f"""# Sweep Report
+
+- Configurations: {sweep['plan']['configs']}
+- Workers: {sweep['workers']} x {sweep['threads_per_worker']} threads
+
+## Shared Work
+{markdown_table(['Stage', 'Planned', 'Separate runs'], plan_rows)}
+
+## Results
+{markdown_table(['Seed', 'n_samples', 'Vectorizer', 'ST model', 'Encoder', 'Reducer', 'Part1 best (Macro-F1)', 'Part2 best (Macro-F1)', 'Chosen K'], rows)}
+"""
+    (out_dir / "SWEEP_REPORT.md").write_text(content, encoding="utf-8")
+    print(content)
+    return sweep
+
+
+if __name__ == "__main__":
+    parser = get_parser()
+    run(parser.parse_args())
@@ -7,12 +7,12 @@ import numpy as np
 from sklearn.cluster import KMeans
 
 
-def elbow_search(embeddings: np.ndarray, ks=range(2, 10), seed: int = 42):
+def elbow_search(embeddings: np.ndarray, ks=range(2, 10), seed: int = 42, sample_weight: np.ndarray | None = None):
     inertias = []
     models = {}
     for k in ks:
         km = KMeans(n_clusters=k, random_state=seed, n_init=10)
-        km.fit(embeddings)
+        km.fit(embeddings, sample_weight=sample_weight)
         inertias.append(float(km.inertia_))
         models[k] = km
 
@@ -9,6 +9,10 @@ class PipelineConfig:
     test_size: float = 0.2
     vectorizer: str = "tfidf"
     st_model: str = "all-MiniLM-L6-v2"
+    encoder_backend: str = "torch"
+    reducer: str = "none"
+    reduce_dim: int = 128
+    dedup: str = "none"
     outputs_dir: str = "outputs"
 
 
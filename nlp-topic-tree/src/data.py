@@ -6,43 +6,50 @@ import numpy as np
 from sklearn.datasets import fetch_20newsgroups
 from sklearn.model_selection import train_test_split
 
+from .textstore import TextColumn
+
 
 @dataclass
 class DatasetBundle:
-    texts: list[str]
+    texts: TextColumn
     y: np.ndarray
     target_names: list[str]
 
 
 @dataclass
 class SplitBundle:
-    x_train: list[str]
-    x_test: list[str]
+    x_train: TextColumn
+    x_test: TextColumn
     y_train: np.ndarray
     y_test: np.ndarray
 
 
-def load_dataset(n_samples: int = 10_000, seed: int = 42) -> DatasetBundle:
-    dataset = fetch_20newsgroups(subset="all", remove=("headers", "footers", "quotes"))
-    texts = np.array(dataset.data, dtype=object)
+def fetch_corpus():
+    return fetch_20newsgroups(subset="all", remove=("headers", "footers", "quotes"))
+
+
+def load_dataset(n_samples: int = 10_000, seed: int = 42, dataset=None) -> DatasetBundle:
+    dataset = dataset if dataset is not None else fetch_corpus()
     y = np.array(dataset.target)
 
-    if n_samples > len(texts):
-        raise ValueError(f"n_samples={n_samples} exceeds dataset size {len(texts)}")
+    if n_samples > len(dataset.data):
+        raise ValueError(f"n_samples={n_samples} exceeds dataset size {len(dataset.data)}")
 
     rng = np.random.default_rng(seed)
-    idx = rng.choice(len(texts), size=n_samples, replace=False)
-    sampled_texts = texts[idx].tolist()
+    idx = rng.choice(len(dataset.data), size=n_samples, replace=False)
+    sampled_texts = TextColumn.from_texts(dataset.data[i] for i in idx)
     sampled_y = y[idx]
     return DatasetBundle(texts=sampled_texts, y=sampled_y, target_names=dataset.target_names)
 
 
-def stratified_split(texts: list[str], y: np.ndarray, test_size: float = 0.2, seed: int = 42) -> SplitBundle:
-    x_train, x_test, y_train, y_test = train_test_split(
-        texts,
+def stratified_split(texts, y: np.ndarray, test_size: float = 0.2, seed: int = 42) -> SplitBundle:
+    train_idx, test_idx, y_train, y_test = train_test_split(
+        np.arange(len(y)),
         y,
         test_size=test_size,
         random_state=seed,
         stratify=y,
     )
-    return SplitBundle(x_train=x_train, x_test=x_test, y_train=y_train, y_test=y_test)
+    if isinstance(texts, list):
+        return SplitBundle([texts[i] for i in train_idx], [texts[i] for i in test_idx], y_train, y_test)
+    return SplitBundle(x_train=texts[train_idx], x_test=texts[test_idx], y_train=y_train, y_test=y_test)
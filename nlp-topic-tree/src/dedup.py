@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+import zlib
+from collections import defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+_MERSENNE = np.uint64((1 << 31) - 1)
+
+
+@dataclass
+class DedupResult:
+    representatives: np.ndarray
+    weights: np.ndarray
+    inverse: np.ndarray
+    stats: dict
+
+    def fan_out(self, values: np.ndarray) -> np.ndarray:
+        return values[self.inverse]
+
+
+def normalize_text(text: str) -> str:
+    return " ".join(re.findall(r"\w+", text.lower()))
+
+
+def _shingle_hashes(text: str, width: int) -> np.ndarray:
+    words = text.split()
+    if len(words) < width:
+        grams = [text]
+    else:
+        grams = [" ".join(words[i : i + width]) for i in range(len(words) - width + 1)]
+    hashes = {zlib.crc32(g.encode("utf-8")) & 0x7FFFFFFF for g in grams}
+    return np.fromiter(hashes, dtype=np.uint64, count=len(hashes))
+
+
+def minhash_signatures(texts: list[str], num_perm: int = 64, shingle_width: int = 3, seed: int = 42) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    a = rng.integers(1, int(_MERSENNE), size=num_perm, dtype=np.uint64)
+    b = rng.integers(0, int(_MERSENNE), size=num_perm, dtype=np.uint64)
+    signatures = np.empty((len(texts), num_perm), dtype=np.uint32)
+    for i, text in enumerate(texts):
+        shingles = _shingle_hashes(text, shingle_width)
+        signatures[i] = ((np.outer(shingles, a) + b) % _MERSENNE).min(axis=0)
+    return signatures
+
+
+def _find(parent: np.ndarray, i: int) -> int:
+    while parent[i] != i:
+        parent[i] = parent[parent[i]]
+        i = parent[i]
+    return i
+
+
+def _union(parent: np.ndarray, i: int, j: int):
+    ri, rj = _find(parent, i), _find(parent, j)
+    if ri != rj:
+        parent[max(ri, rj)] = min(ri, rj)
+
+
+def dedup_texts(
+    texts: list[str],
+    mode: str = "near",
+    threshold: float = 0.8,
+    num_perm: int = 64,
+    bands: int = 8,
+    seed: int = 42,
+) -> DedupResult:
+    if mode not in {"exact", "near"}:
+        raise ValueError(f"Unknown dedup mode: {mode}")
+    if num_perm % bands:
+        raise ValueError(f"num_perm={num_perm} must be divisible by bands={bands}")
+
+    normalized = [normalize_text(t) for t in texts]
+    parent = np.arange(len(texts))
+
+    first_seen: dict[bytes, int] = {}
+    for i, text in enumerate(normalized):
+        key = hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+        if key in first_seen:
+            _union(parent, first_seen[key], i)
+        else:
+            first_seen[key] = i
+    n_exact_unique = len(first_seen)
+
+    if mode == "near":
+        candidates = [i for i in sorted(first_seen.values()) if normalized[i]]
+        signatures = minhash_signatures([normalized[i] for i in candidates], num_perm=num_perm, seed=seed)
+        rows = num_perm // bands
+        neighbours: dict[int, set[int]] = defaultdict(set)
+        for band in range(bands):
+            buckets: dict[bytes, list[int]] = defaultdict(list)
+            band_sig = signatures[:, band * rows : (band + 1) * rows]
+            for pos, row in enumerate(band_sig):
+                buckets[row.tobytes()].append(pos)
+            for members in buckets.values():
+                for i, pos in enumerate(members[1:], start=1):
+                    neighbours[pos].update(members[:i])
+
+        # Each document joins the most similar earlier group representative that clears the threshold,
+        # never another member, so groups do not chain: every member agrees with its representative on
+        # >= threshold of the signature, and any two members on >= 2 * threshold - 1.
+        is_rep = np.ones(len(candidates), dtype=bool)
+        for pos in range(len(candidates)):
+            reps = np.array(sorted(i for i in neighbours.get(pos, ()) if is_rep[i]), dtype=np.int64)
+            if not len(reps):
+                continue
+            agreement = np.mean(signatures[reps] == signatures[pos], axis=1)
+            best = int(np.argmax(agreement))
+            if agreement[best] >= threshold:
+                is_rep[pos] = False
+                _union(parent, candidates[reps[best]], candidates[pos])
+
+    roots = np.array([_find(parent, i) for i in range(len(texts))])
+    representatives, inverse, weights = np.unique(roots, return_inverse=True, return_counts=True)
+    n_empty = sum(1 for t in normalized if not t)
+    stats = {
+        "mode": mode,
+        "n_docs": len(texts),
+        "n_unique": int(len(representatives)),
+        "n_exact_duplicates": int(len(texts) - n_exact_unique),
+        "n_near_duplicates": int(n_exact_unique - len(representatives)),
+        "n_empty": int(n_empty),
+        "largest_group": int(weights.max()) if len(weights) else 0,
+        "encoding_saved_fraction": float(1 - len(representatives) / len(texts)) if texts else 0.0,
+    }
+    return DedupResult(representatives=representatives, weights=weights, inverse=inverse, stats=stats)
+
+
+def save_dedup_stats(path: Path, result: DedupResult):
+    with path.open("w", encoding="utf-8") as f:
+        json.dump(result.stats, f, indent=2)
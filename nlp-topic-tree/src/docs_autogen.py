@@ -3,6 +3,7 @@ from __future__ import annotations
 from pathlib import Path
 
 from .config import DEFAULT_CONFIG
+from .reporting import write_if_changed
 
 
 def _parser_options(parser) -> str:
@@ -35,6 +36,11 @@ cp .env.example .env
 - Part 2: `python scripts/run_part2_embeddings.py`
 - Part 3: `python scripts/run_part3_topic_tree.py`
 - Full run: `python scripts/run_all.py`
+- Reduction benchmark: `python scripts/run_reduction_benchmark.py`
+- Configuration sweep: `python scripts/run_sweep.py --seeds 1 2 --vectorizers bow tfidf`
+- Encoder backend check: `python scripts/run_encoder_check.py --backends torch-int8`
+- Route new documents: `python scripts/route_documents.py --input new_docs.txt`
+- Tests: `python -m pytest -q`
 - Demo walkthrough (recommended for recording): `python scripts/demo.py`
 
 ## CLI Options (source of truth = argparse)
@@ -46,6 +52,27 @@ cp .env.example .env
 ## Outputs
 All outputs are written to `outputs/` (or `--outputs-dir`). Key artifacts include metrics JSON, confusion matrices, elbow analysis, cluster labels, and `DEMO_REPORT.md`.
 
+## Dimensionality Reduction
+`--reducer` (`pca`, `gaussian_rp`, `sparse_rp`, `svd`) and `--reduce-dim` insert a reduction stage ahead of the classifiers and KMeans. Reducers are fit once on the training features, saved as `reducer_part1.joblib` / `reducer_part2.joblib` / `reducer_part3.joblib`, and applied in chunks. Part 1 fits its vectorizer once as well (`vectorizer_part1.joblib`) and trains the classifiers on the reduced dense matrix; it works on sparse features, so `pca` runs as `svd` there. `run_reduction_benchmark.py` reports matrix size, peak reduction memory, fit time and Macro-F1 per output dimension for both the part 1 vectorizer features and the embeddings (plus KMeans inertia for the embeddings) in `reduction_benchmark.md`.
+
+## Deduplication
+`--dedup exact` collapses documents whose normalized text is identical (including posts left empty after header/footer/quote removal); `--dedup near` additionally merges MinHash/LSH near duplicates, each document joining the closest earlier group representative it matches (no transitive chaining through other members). Part 3 encodes and clusters one weighted representative per group, fans the assignments back out to every document (`cluster_assignments.json`), and records the encoding work saved in `dedup_part3.json` and `DEMO_REPORT.md`.
+
+## Sweeps
+`run_sweep.py` expands a grid of `PipelineConfig` values and plans the shared work: the corpus is fetched once and each seed/n_samples sample is drawn from it once, each SentenceTransformer model encodes each dataset once, and part 1/2/3 runs that only differ in unrelated options are reused. Embeddings are encoded first using all `--cores`; the independent runs are then scheduled on a thread pool of `--workers`, each capped to an even share of `--cores` BLAS/OpenMP threads. Part 3 in a sweep stops at the elbow search (no labeling). Results land in `sweep_results.json` and `SWEEP_REPORT.md`.
+
+## Encoder Backends
+`--encoder-backend` selects how sentences are embedded: `torch` (stock float32 SentenceTransformer), `torch-int8` (dynamically quantized `nn.Linear` layers on CPU) or `onnx` (ONNX Runtime; needs a local `onnx/model.onnx` export of the model and the optional extras from `pip install "sentence-transformers[onnx]"`). Each model/backend pair is loaded once per process, and `--encoder-threads` sets the CPU thread count. `run_encoder_check.py` compares candidate backends with the float32 reference and reports model load time, warm encode time, speedup, cosine agreement, the Macro-F1 change of each classifier against the same classifier on reference embeddings, and the best-vs-best change in `encoder_check.md`.
+
+## Topic Tree Export
+Part 3 streams the full tree to disk: `topic_tree.txt`, `topic_tree.md`, `topic_tree.jsonl` (one node per line, parents followed by their children, largest first at each level), a columnar node table `topic_nodes.npz`, and per-level document membership `topic_members.npz` (documents grouped by node, with offsets). The printed tree and `DEMO_REPORT.md` show the largest clusters and subclusters, truncated by `--tree-max-top` / `--tree-max-children`; `src.topic_tree.render_tree_from_jsonl` builds the same view by reading only the head of the JSONL file.
+
+## Reporting
+Figures are rendered with the headless Agg backend in a small process pool (`REPORT_WORKERS`, default 2; `0` renders inline), so plotting overlaps with the rest of the run. Each figure's input data is hashed into `.figure_hashes.json` in the outputs directory, and figures with unchanged inputs are skipped. README/ARCHITECTURE and `DEMO_REPORT.md` are only rewritten when their content changes, and the report's tree section is streamed from `topic_tree.jsonl`.
+
+## Topic Index and Routing
+Part 3 also saves the tree as a centroid index (`topic_index.npz` + `topic_index.json`): one contiguous centroid matrix per level, plus offsets that give each parent's block of child rows. `route_documents.py` encodes new documents in batches, applies the saved reducer if part 3 used one, and descends from root to leaf. Each document is compared only with the root centroids and the children of its chosen parents (O(depth x k)). `--top-n` keeps several paths ranked level by level (by the parent's rank, then by distance at the next level), so the first route is always the greedy descent. A path's score is its cumulative squared distance with one term per level; a path that ends at a leaf above the bottom level repeats that leaf's distance for each missing level, so scores stay comparable across depths. Results are written as JSONL.
+
 ## LLM Labeling
 If `OPENAI_API_KEY` is set, OpenAI labeling is used. Otherwise the pipeline automatically falls back to a heuristic labeler and prints a warning.
 """
@@ -55,27 +82,37 @@ If `OPENAI_API_KEY` is set, OpenAI labeling is used. Otherwise the pipeline auto
 ## Data Flow
 ```text
 20 Newsgroups -> deterministic 10k sample -> stratified split
-  -> Part 1: vectorizer (BoW/TF-IDF) + classifiers -> metrics/confusions/plot
-  -> Part 2: SentenceTransformer embeddings + classifiers -> metrics/confusions/plot
-  -> Part 3: embeddings -> elbow KMeans -> top labels -> subcluster labels -> topic tree
+  -> Part 1: vectorizer (BoW/TF-IDF) -> [optional reducer] -> classifiers -> metrics/confusions/plot
+  -> Part 2: SentenceTransformer embeddings -> [optional reducer] -> classifiers -> metrics/confusions/plot
+  -> Part 3: [optional dedup] -> embeddings -> [optional reducer] -> elbow KMeans -> top labels -> subcluster labels -> topic tree + centroid index
 ```
 
 ## Module Responsibilities
 - `src/config.py`: Defaults and output directory helpers
 - `src/data.py`: Dataset loading and deterministic sampling/splitting
-- `src/features.py`: Vectorizers and embedding generation
+- `src/textstore.py`: `TextColumn`, a UTF-8 byte buffer + offsets text container with zero-copy index views and memory-mapped save/load
+- `src/encoders.py`: Pluggable torch / int8-quantized torch / ONNX Runtime encoder backends and cosine agreement
+- `src/features.py`: Vectorizers, cached encoder loading and chunked embedding generation
 - `src/models.py`: Classifier definitions for both feature families
-- `src/eval.py`: Metrics and confusion extraction
+- `src/reduction.py`: PCA / random projection / truncated SVD reducers, chunked transform and persistence
+- `src/dedup.py`: Exact and MinHash/LSH near-duplicate grouping with weighted representatives
+- `src/eval.py`: Metrics, confusion extraction and model comparison loop
 - `src/clustering.py`: Elbow search and representative document selection
+- `src/sweep.py`: Grid expansion, shared-artifact planning and pooled execution for sweeps
 - `src/labeling.py`: OpenAI + heuristic labeling backends
-- `src/topic_tree.py`: Text rendering for the 2-level tree
-- `src/reporting.py`: Plotting and markdown report generation
+- `src/topic_tree.py`: Streaming text/Markdown/JSONL/columnar export and truncated rendering of the topic tree
+- `src/topic_index.py`: Array-backed per-level centroid index with batched beam routing and npz/JSON export
+- `src/reporting.py`: Pooled, change-aware headless plotting and streamed markdown report generation
 - `src/docs_autogen.py`: Regenerates README and ARCHITECTURE from parser/config defaults
 
 ## Scripts
 - `run_part1_classic.py`: Runs classic feature model comparison
 - `run_part2_embeddings.py`: Runs embedding model comparison
 - `run_part3_topic_tree.py`: Runs clustering and hierarchical topic labeling
+- `run_reduction_benchmark.py`: Compares reducers per output dimension against full-width vectorizer features and embeddings
+- `run_sweep.py`: Runs a configuration grid in one process and writes SWEEP_REPORT
+- `run_encoder_check.py`: Compares encoder backends with float32 reference embeddings
+- `route_documents.py`: Routes new documents through the saved topic index
 - `run_all.py`: Regenerates docs and runs parts 1-3 non-narrated
 - `demo.py`: Regenerates docs, prints narration, runs full pipeline, writes DEMO_REPORT
 
@@ -85,8 +122,12 @@ If `OPENAI_API_KEY` is set, OpenAI labeling is used. Otherwise the pipeline auto
 - test_size: {DEFAULT_CONFIG.test_size}
 - vectorizer: {DEFAULT_CONFIG.vectorizer}
 - st_model: {DEFAULT_CONFIG.st_model}
+- encoder_backend: {DEFAULT_CONFIG.encoder_backend}
+- reducer: {DEFAULT_CONFIG.reducer}
+- reduce_dim: {DEFAULT_CONFIG.reduce_dim}
+- dedup: {DEFAULT_CONFIG.dedup}
 - outputs_dir: {DEFAULT_CONFIG.outputs_dir}
 """
 
-    (project_root / "README.md").write_text(readme, encoding="utf-8")
-    (project_root / "ARCHITECTURE.md").write_text(arch, encoding="utf-8")
+    write_if_changed(project_root / "README.md", readme)
+    write_if_changed(project_root / "ARCHITECTURE.md", arch)
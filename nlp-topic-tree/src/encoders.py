@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from functools import lru_cache
+
+import numpy as np
+
+ENCODER_BACKENDS = ["torch", "torch-int8", "onnx"]
+
+
+class BaseEncoder(ABC):
+    @abstractmethod
+    def encode(self, texts: list[str], batch_size: int = 64) -> np.ndarray:
+        raise NotImplementedError
+
+    @property
+    @abstractmethod
+    def dimension(self) -> int:
+        raise NotImplementedError
+
+
+class TorchEncoder(BaseEncoder):
+    def __init__(self, model_name: str, threads: int | None = None, device: str | None = None):
+        from sentence_transformers import SentenceTransformer
+
+        self.threads = threads
+        self.model = SentenceTransformer(model_name, device=device)
+
+    def encode(self, texts: list[str], batch_size: int = 64) -> np.ndarray:
+        import torch
+
+        # torch's thread count is process-wide, so it is applied per call and restored afterwards.
+        previous = torch.get_num_threads()
+        if self.threads:
+            torch.set_num_threads(self.threads)
+        try:
+            return self.model.encode(texts, batch_size=batch_size, show_progress_bar=True, convert_to_numpy=True)
+        finally:
+            torch.set_num_threads(previous)
+
+    @property
+    def dimension(self) -> int:
+        return self.model.get_sentence_embedding_dimension()
+
+
+class QuantizedTorchEncoder(TorchEncoder):
+    def __init__(self, model_name: str, threads: int | None = None):
+        import torch
+
+        super().__init__(model_name, threads=threads, device="cpu")
+        self.model = torch.ao.quantization.quantize_dynamic(self.model, {torch.nn.Linear}, dtype=torch.qint8)
+
+
+class OnnxEncoder(TorchEncoder):
+    def __init__(self, model_name: str, threads: int | None = None, file_name: str = "onnx/model.onnx"):
+        try:
+            import onnxruntime as ort
+            import optimum.onnxruntime  # noqa: F401
+        except ImportError as exc:
+            raise ImportError(
+                "The onnx encoder backend needs onnxruntime and optimum: pip install 'sentence-transformers[onnx]'"
+            ) from exc
+        from sentence_transformers import SentenceTransformer
+
+        self.threads = None
+        session_options = ort.SessionOptions()
+        if threads:
+            session_options.intra_op_num_threads = threads
+        try:
+            self.model = SentenceTransformer(
+                model_name,
+                device="cpu",
+                backend="onnx",
+                local_files_only=True,
+                model_kwargs={
+                    "file_name": file_name,
+                    "provider": "CPUExecutionProvider",
+                    "session_options": session_options,
+                },
+            )
+        except TypeError as exc:
+            raise ImportError("The onnx encoder backend needs sentence-transformers>=3.2.0") from exc
+        except OSError as exc:
+            raise ValueError(
+                f"No local ONNX export '{file_name}' for {model_name}; export it first or use another backend"
+            ) from exc
+
+
+@lru_cache(maxsize=None)
+def get_encoder(model_name: str, backend: str = "torch", threads: int | None = None) -> BaseEncoder:
+    if backend == "torch":
+        return TorchEncoder(model_name, threads=threads)
+    if backend == "torch-int8":
+        return QuantizedTorchEncoder(model_name, threads=threads)
+    if backend == "onnx":
+        return OnnxEncoder(model_name, threads=threads)
+    raise ValueError(f"Unknown encoder backend: {backend}")
+
+
+def cosine_agreement(reference: np.ndarray, candidate: np.ndarray) -> dict:
+    ref = reference / np.maximum(np.linalg.norm(reference, axis=1, keepdims=True), 1e-12)
+    cand = candidate / np.maximum(np.linalg.norm(candidate, axis=1, keepdims=True), 1e-12)
+    cos = np.sum(ref * cand, axis=1)
+    return {
+        "mean": float(cos.mean()),
+        "min": float(cos.min()),
+        "p05": float(np.percentile(cos, 5)),
+    }
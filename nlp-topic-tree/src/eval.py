@@ -20,6 +20,20 @@ def evaluate_predictions(y_true, y_pred, target_names: list[str], top_n: int = 1
     }
 
 
+def compare_models(models: dict, x_train, y_train, x_test, y_test, target_names: list[str]):
+    metrics, confusions = {}, {}
+    best = None
+    for name, model in models.items():
+        model.fit(x_train, y_train)
+        pred = model.predict(x_test)
+        ev = evaluate_predictions(y_test, pred, target_names)
+        metrics[name] = {"accuracy": ev["accuracy"], "macro_f1": ev["macro_f1"]}
+        confusions[name] = ev["top_confusions"]
+        if best is None or ev["macro_f1"] > best[1]["macro_f1"]:
+            best = (name, ev)
+    return metrics, confusions, best
+
+
 def top_confusion_pairs(cm: np.ndarray, target_names: list[str], top_n: int = 15):
     pairs = []
     for i in range(cm.shape[0]):
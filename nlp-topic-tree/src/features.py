@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import numpy as np
-from sentence_transformers import SentenceTransformer
 from sklearn.feature_extraction.text import CountVectorizer, TfidfVectorizer
 
 
@@ -13,6 +12,24 @@ def build_vectorizer(name: str):
     raise ValueError(f"Unknown vectorizer: {name}")
 
 
-def encode_texts(texts: list[str], model_name: str, batch_size: int = 64) -> np.ndarray:
-    model = SentenceTransformer(model_name)
-    return model.encode(texts, batch_size=batch_size, show_progress_bar=True, convert_to_numpy=True)
+def encode_texts(
+    texts,
+    model_name: str,
+    batch_size: int = 64,
+    chunk_size: int = 16_384,
+    backend: str = "torch",
+    threads: int | None = None,
+) -> np.ndarray:
+    from .encoders import get_encoder
+
+    encoder = get_encoder(model_name, backend=backend, threads=threads)
+    out = None
+    for start in range(0, len(texts), chunk_size):
+        chunk = list(texts[start : start + chunk_size])
+        emb = encoder.encode(chunk, batch_size=batch_size)
+        if out is None:
+            out = np.empty((len(texts), emb.shape[1]), dtype=emb.dtype)
+        out[start : start + len(chunk)] = emb
+    if out is None:
+        return np.empty((0, encoder.dimension), dtype=np.float32)
+    return out
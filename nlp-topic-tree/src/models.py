@@ -8,9 +8,10 @@ from sklearn.preprocessing import MinMaxScaler
 from sklearn.svm import LinearSVC
 
 from .features import build_vectorizer
+from .reduction import fit_reducer, sparse_reducer_name, transform_in_chunks
 
 
-def classic_model_pipelines(vectorizer_name: str, seed: int = 42) -> dict[str, Pipeline]:
+def classic_model_pipelines(vectorizer_name: str, seed: int = 42, n_jobs: int = -1) -> dict[str, Pipeline]:
     return {
         "mnb": Pipeline([
             ("vectorizer", build_vectorizer(vectorizer_name)),
@@ -26,12 +27,23 @@ def classic_model_pipelines(vectorizer_name: str, seed: int = 42) -> dict[str, P
         ]),
         "rf": Pipeline([
             ("vectorizer", build_vectorizer(vectorizer_name)),
-            ("model", RandomForestClassifier(n_estimators=300, random_state=seed, n_jobs=-1)),
+            ("model", RandomForestClassifier(n_estimators=300, random_state=seed, n_jobs=n_jobs)),
         ]),
     }
 
 
-def embedding_models(seed: int = 42) -> dict[str, Pipeline | object]:
+def classic_reduced_features(vectorizer_name: str, x_train, x_test, reducer: str, reduce_dim: int, seed: int = 42):
+    if sparse_reducer_name(reducer) != reducer:
+        print(f"[WARN] {reducer} does not accept sparse features. Using {sparse_reducer_name(reducer)} for part1.")
+        reducer = sparse_reducer_name(reducer)
+    vectorizer = build_vectorizer(vectorizer_name)
+    v_train = vectorizer.fit_transform(x_train)
+    v_test = vectorizer.transform(x_test)
+    fitted = fit_reducer(v_train, reducer, reduce_dim, seed=seed)
+    return vectorizer, fitted, transform_in_chunks(fitted, v_train), transform_in_chunks(fitted, v_test)
+
+
+def embedding_models(seed: int = 42, n_jobs: int = -1) -> dict[str, Pipeline | object]:
     return {
         "mnb": Pipeline([
             ("scale", MinMaxScaler()),
@@ -39,5 +51,5 @@ def embedding_models(seed: int = 42) -> dict[str, Pipeline | object]:
         ]),
         "logreg": LogisticRegression(max_iter=2_000, random_state=seed),
         "linearsvm": LinearSVC(random_state=seed),
-        "rf": RandomForestClassifier(n_estimators=300, random_state=seed, n_jobs=-1),
+        "rf": RandomForestClassifier(n_estimators=300, random_state=seed, n_jobs=n_jobs),
     }
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import joblib
+import numpy as np
+from sklearn.decomposition import PCA, TruncatedSVD
+from sklearn.random_projection import GaussianRandomProjection, SparseRandomProjection
+
+REDUCERS = ["none", "pca", "gaussian_rp", "sparse_rp", "svd"]
+
+
+def build_reducer(name: str, n_components: int, seed: int = 42):
+    if name == "none":
+        return None
+    if name == "pca":
+        return PCA(n_components=n_components, svd_solver="randomized", random_state=seed)
+    if name == "gaussian_rp":
+        return GaussianRandomProjection(n_components=n_components, random_state=seed)
+    if name == "sparse_rp":
+        return SparseRandomProjection(n_components=n_components, dense_output=True, random_state=seed)
+    if name == "svd":
+        return TruncatedSVD(n_components=n_components, algorithm="randomized", random_state=seed)
+    raise ValueError(f"Unknown reducer: {name}")
+
+
+def sparse_reducer_name(name: str) -> str:
+    return "svd" if name == "pca" else name
+
+
+def fit_reducer(x, name: str, n_components: int, seed: int = 42):
+    reducer = build_reducer(name, n_components, seed=seed)
+    if reducer is None:
+        return None
+    n_components = min(n_components, x.shape[1])
+    reducer.set_params(n_components=n_components)
+    reducer.fit(x)
+    return reducer
+
+
+def transform_in_chunks(reducer, x, chunk_size: int = 8_192) -> np.ndarray:
+    if reducer is None:
+        return x
+    n_components = reducer.n_components_ if hasattr(reducer, "n_components_") else reducer.n_components
+    out = np.empty((x.shape[0], n_components), dtype=np.float32)
+    for start in range(0, x.shape[0], chunk_size):
+        stop = min(start + chunk_size, x.shape[0])
+        out[start:stop] = reducer.transform(x[start:stop])
+    return out
+
+
+def save_reducer(path: Path, reducer):
+    joblib.dump(reducer, path)
+
+
+def load_reducer(path: Path):
+    return joblib.load(path)
@@ -1,8 +1,14 @@
 from __future__ import annotations
 
+import atexit
+import hashlib
+import json
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Iterable
 
-import matplotlib.pyplot as plt
 import numpy as np
 
 
@@ -13,7 +19,17 @@ def markdown_table(headers: list[str], rows: list[list[str]]) -> str:
     return "\n".join([head, sep, *body])
 
 
+def _pyplot():
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    return plt
+
+
 def plot_confusion_matrix(cm: np.ndarray, path: Path, title: str):
+    plt = _pyplot()
     plt.figure(figsize=(10, 8))
     plt.imshow(cm, interpolation="nearest", cmap="Blues")
     plt.title(title)
@@ -26,6 +42,7 @@ def plot_confusion_matrix(cm: np.ndarray, path: Path, title: str):
 
 
 def plot_elbow(ks: list[int], inertias: list[float], chosen_k: int, path: Path):
+    plt = _pyplot()
     plt.figure(figsize=(7, 5))
     plt.plot(ks, inertias, marker="o")
     plt.axvline(chosen_k, linestyle="--", color="red", label=f"chosen_k={chosen_k}")
@@ -38,6 +55,102 @@ def plot_elbow(ks: list[int], inertias: list[float], chosen_k: int, path: Path):
     plt.close()
 
 
+def input_hash(*parts) -> str:
+    digest = hashlib.sha256()
+    for part in parts:
+        if isinstance(part, np.ndarray):
+            digest.update(f"{part.dtype}{part.shape}".encode("utf-8"))
+            digest.update(np.ascontiguousarray(part).tobytes())
+        else:
+            digest.update(json.dumps(part, sort_keys=True, default=str).encode("utf-8"))
+    return digest.hexdigest()
+
+
+class FigureRenderer:
+    MANIFEST = ".figure_hashes.json"
+
+    def __init__(self, workers: int = 2):
+        self.workers = workers
+        self._pool: ProcessPoolExecutor | None = None
+        self._pending: list[tuple] = []
+        self._manifests: dict[Path, dict] = {}
+
+    def _manifest(self, out_dir: Path) -> dict:
+        if out_dir not in self._manifests:
+            manifest_path = out_dir / self.MANIFEST
+            self._manifests[out_dir] = (
+                json.loads(manifest_path.read_text(encoding="utf-8")) if manifest_path.exists() else {}
+            )
+        return self._manifests[out_dir]
+
+    def submit(self, plot_fn, path: Path, **kwargs) -> bool:
+        path = Path(path)
+        key = input_hash(plot_fn.__name__, *(kwargs[name] for name in sorted(kwargs)), sorted(kwargs))
+        if path.exists() and self._manifest(path.parent).get(path.name) == key:
+            return False
+        if self.workers <= 0:
+            plot_fn(path=path, **kwargs)
+            self._manifest(path.parent)[path.name] = key
+            self._save(path.parent)
+            return True
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.workers, mp_context=multiprocessing.get_context("spawn"))
+        self._pending.append((self._pool.submit(plot_fn, path=path, **kwargs), path, key))
+        return True
+
+    def _save(self, out_dir: Path):
+        (out_dir / self.MANIFEST).write_text(json.dumps(self._manifests[out_dir], indent=2), encoding="utf-8")
+
+    def wait(self):
+        pending, self._pending = self._pending, []
+        for future, path, key in pending:
+            future.result()
+            self._manifest(path.parent)[path.name] = key
+        for out_dir in {path.parent for _, path, _ in pending}:
+            self._save(out_dir)
+
+    def close(self):
+        self.wait()
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+
+_RENDERER: FigureRenderer | None = None
+
+
+def get_renderer() -> FigureRenderer:
+    global _RENDERER
+    if _RENDERER is None:
+        _RENDERER = FigureRenderer(workers=int(os.getenv("REPORT_WORKERS", "2")))
+        atexit.register(_RENDERER.close)
+    return _RENDERER
+
+
+def render_figure(plot_fn, path: Path, **kwargs) -> bool:
+    return get_renderer().submit(plot_fn, path, **kwargs)
+
+
+def wait_for_figures():
+    if _RENDERER is not None:
+        _RENDERER.wait()
+
+
+def write_if_changed(path: Path, content: str) -> bool:
+    if path.exists() and path.read_text(encoding="utf-8") == content:
+        return False
+    path.write_text(content, encoding="utf-8")
+    return True
+
+
+def _replace_if_changed(tmp_path: Path, path: Path) -> bool:
+    if path.exists() and path.stat().st_size == tmp_path.stat().st_size and path.read_bytes() == tmp_path.read_bytes():
+        tmp_path.unlink()
+        return False
+    os.replace(tmp_path, path)
+    return True
+
+
 def write_demo_report(
     path: Path,
     config: dict,
@@ -45,7 +158,9 @@ def write_demo_report(
     p2_metrics: dict,
     chosen_k: int,
     top_clusters: list[dict],
-    tree_text: str,
+    tree_lines: Iterable[str],
+    dedup_stats: dict | None = None,
+    max_clusters: int | None = 50,
 ):
     p1_rows = [[k, f"{v['accuracy']:.4f}", f"{v['macro_f1']:.4f}"] for k, v in p1_metrics.items()]
     p2_rows = [[k, f"{v['accuracy']:.4f}", f"{v['macro_f1']:.4f}"] for k, v in p2_metrics.items()]
@@ -57,9 +172,23 @@ def write_demo_report(
         f"best embedding model is **{p2_best[0]}** (Macro-F1={p2_best[1]['macro_f1']:.4f})."
     )
 
-    cluster_rows = [[c["cluster_id"], c["label"], c["size"]] for c in top_clusters]
+    largest = sorted(top_clusters, key=lambda c: c["size"], reverse=True)[:max_clusters]
+    cluster_rows = [[c["cluster_id"], c["label"], c["size"]] for c in largest]
+    if len(largest) < len(top_clusters):
+        cluster_rows.append(["...", f"{len(top_clusters) - len(largest)} smaller clusters omitted", ""])
+
+    dedup_section = ""
+    if dedup_stats:
+        dedup_section = f"""
+### Deduplication ({dedup_stats['mode']})
+- Documents: {dedup_stats['n_docs']}, encoded: {dedup_stats['n_unique']}
+- Exact duplicates: {dedup_stats['n_exact_duplicates']}, near duplicates: {dedup_stats['n_near_duplicates']}, empty: {dedup_stats['n_empty']}
+- Encoding work saved: **{dedup_stats['encoding_saved_fraction']:.1%}**
+"""
 
-    content = f"""# Demo Report
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    with tmp_path.open("w", encoding="utf-8") as f:
+        f.write(f"""# Demo Report
 
 ## Environment + Config
 - Seed: {config['seed']}
@@ -85,11 +214,13 @@ def write_demo_report(
 ![Elbow](elbow.png)
 
 - Chosen K: **{chosen_k}**
-
+{dedup_section}
 {markdown_table(['Cluster', 'Label', 'Size'], cluster_rows)}
 
 ```text
-{tree_text}
-```
-"""
-    path.write_text(content, encoding="utf-8")
+""")
+        for line in tree_lines:
+            f.write(line)
+            f.write("\n")
+        f.write("```\n")
+    return _replace_if_changed(tmp_path, path)
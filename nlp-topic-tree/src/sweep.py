@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+import itertools
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, replace
+
+import numpy as np
+
+from .config import PipelineConfig
+from .reduction import sparse_reducer_name
+
+
+def expand_grid(base: PipelineConfig, **axes) -> list[PipelineConfig]:
+    names = [name for name, values in axes.items() if values]
+    configs = {}
+    for combo in itertools.product(*(axes[name] for name in names)):
+        config = replace(base, **dict(zip(names, combo)))
+        configs.setdefault(tuple(asdict(config).values()), config)
+    return list(configs.values())
+
+
+def _data_key(c: PipelineConfig) -> tuple:
+    return (c.seed, c.n_samples)
+
+
+def _embedding_key(c: PipelineConfig) -> tuple:
+    return (c.seed, c.n_samples, c.st_model, c.encoder_backend)
+
+
+def _part1_key(c: PipelineConfig) -> tuple:
+    reducer = sparse_reducer_name(c.reducer)
+    return (c.seed, c.n_samples, c.test_size, c.vectorizer, reducer, c.reduce_dim if reducer != "none" else None)
+
+
+def _part2_key(c: PipelineConfig) -> tuple:
+    return (c.seed, c.n_samples, c.test_size, c.st_model, c.encoder_backend, c.reducer, c.reduce_dim if c.reducer != "none" else None)
+
+
+def _part3_key(c: PipelineConfig) -> tuple:
+    return (c.seed, c.n_samples, c.st_model, c.encoder_backend, c.reducer, c.reduce_dim if c.reducer != "none" else None)
+
+
+def build_plan(configs: list[PipelineConfig]) -> dict:
+    return {
+        "configs": configs,
+        "datasets": sorted({_data_key(c) for c in configs}),
+        "embeddings": sorted({_embedding_key(c) for c in configs}),
+        "part1": sorted({_part1_key(c) for c in configs}, key=repr),
+        "part2": sorted({_part2_key(c) for c in configs}, key=repr),
+        "part3": sorted({_part3_key(c) for c in configs}, key=repr),
+    }
+
+
+def plan_summary(plan: dict) -> dict:
+    n = len(plan["configs"])
+    return {
+        "configs": n,
+        "dataset_loads": {"planned": len(plan["datasets"]), "naive": 3 * n},
+        "documents_encoded": {
+            "planned": sum(key[1] for key in plan["embeddings"]),
+            "naive": sum(2 * c.n_samples for c in plan["configs"]),
+        },
+        "part1_runs": {"planned": len(plan["part1"]), "naive": n},
+        "part2_runs": {"planned": len(plan["part2"]), "naive": n},
+        "part3_runs": {"planned": len(plan["part3"]), "naive": n},
+    }
+
+
+def _load_all(keys: list[tuple]) -> dict:
+    from .data import fetch_corpus, load_dataset
+
+    # Fetch the corpus once and sample each (seed, n_samples) key from it in-process.
+    corpus = fetch_corpus()
+    return {key: load_dataset(n_samples=key[1], seed=key[0], dataset=corpus) for key in keys}
+
+
+def _split_indices(data, test_size: float, seed: int):
+    from .data import stratified_split
+
+    split = stratified_split(np.arange(len(data.y)), data.y, test_size=test_size, seed=seed)
+    return split.x_train, split.x_test, split.y_train, split.y_test
+
+
+def _run_part1(key: tuple, data, n_jobs: int) -> dict:
+    from threadpoolctl import threadpool_limits
+
+    from .eval import compare_models
+    from .models import classic_model_pipelines, classic_reduced_features, embedding_models
+
+    seed, _, test_size, vectorizer, reducer, reduce_dim = key
+    train_idx, test_idx, y_train, y_test = _split_indices(data, test_size, seed)
+    with threadpool_limits(limits=n_jobs):
+        if reducer == "none":
+            models = classic_model_pipelines(vectorizer, seed=seed, n_jobs=n_jobs)
+            x_train, x_test = data.texts[train_idx], data.texts[test_idx]
+        else:
+            models = embedding_models(seed=seed, n_jobs=n_jobs)
+            _, _, x_train, x_test = classic_reduced_features(
+                vectorizer, data.texts[train_idx], data.texts[test_idx], reducer, reduce_dim, seed=seed
+            )
+        metrics, _, best = compare_models(models, x_train, y_train, x_test, y_test, data.target_names)
+    return {"metrics": metrics, "best": best[0]}
+
+
+def _reduce(embeddings: np.ndarray, fit_rows: np.ndarray, reducer: str, reduce_dim: int | None, seed: int):
+    from .reduction import fit_reducer, transform_in_chunks
+
+    fitted = fit_reducer(embeddings[fit_rows], reducer, reduce_dim or 128, seed=seed)
+    return transform_in_chunks(fitted, embeddings)
+
+
+def _run_part2(key: tuple, data, embeddings: np.ndarray, n_jobs: int) -> dict:
+    from threadpoolctl import threadpool_limits
+
+    from .eval import compare_models
+    from .models import embedding_models
+
+    seed, _, test_size, _, _, reducer, reduce_dim = key
+    train_idx, test_idx, y_train, y_test = _split_indices(data, test_size, seed)
+    models = embedding_models(seed=seed, n_jobs=n_jobs)
+    with threadpool_limits(limits=n_jobs):
+        x = _reduce(embeddings, train_idx, reducer, reduce_dim, seed)
+        metrics, _, best = compare_models(models, x[train_idx], y_train, x[test_idx], y_test, data.target_names)
+    return {"metrics": metrics, "best": best[0]}
+
+
+def _run_part3(key: tuple, embeddings: np.ndarray, n_jobs: int) -> dict:
+    from threadpoolctl import threadpool_limits
+
+    from .clustering import elbow_search
+
+    seed, _, _, _, reducer, reduce_dim = key
+    with threadpool_limits(limits=n_jobs):
+        x = _reduce(embeddings, np.arange(len(embeddings)), reducer, reduce_dim, seed)
+        elbow = elbow_search(x, ks=range(2, 10), seed=seed)
+    return {"chosen_k": elbow["chosen_k"], "inertias": elbow["inertias"]}
+
+
+def run_sweep(configs: list[PipelineConfig], workers: int = 2, cores: int | None = None) -> dict:
+    from .features import encode_texts
+
+    plan = build_plan(configs)
+    cores = cores or os.cpu_count() or 1
+    workers = max(1, min(workers, cores))
+    threads_per_worker = max(1, cores // workers)
+
+    datasets = _load_all(plan["datasets"])
+    # Encoding uses the whole core budget before the pool starts; pool jobs then share it, each
+    # capping its own BLAS/OpenMP threads (the limits are per calling thread).
+    embeddings = {
+        emb_key: encode_texts(datasets[emb_key[:2]].texts, emb_key[2], backend=emb_key[3], threads=cores)
+        for emb_key in plan["embeddings"]
+    }
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        part1_futures = {
+            key: pool.submit(_run_part1, key, datasets[key[:2]], threads_per_worker) for key in plan["part1"]
+        }
+        part2_futures = {
+            key: pool.submit(_run_part2, key, datasets[key[:2]], embeddings[(key[0], key[1], key[3], key[4])], threads_per_worker)
+            for key in plan["part2"]
+        }
+        part3_futures = {
+            key: pool.submit(_run_part3, key, embeddings[key[:4]], threads_per_worker) for key in plan["part3"]
+        }
+
+        part1 = {key: f.result() for key, f in part1_futures.items()}
+        part2 = {key: f.result() for key, f in part2_futures.items()}
+        part3 = {key: f.result() for key, f in part3_futures.items()}
+
+    rows = []
+    for config in configs:
+        p1 = part1[_part1_key(config)]
+        p2 = part2[_part2_key(config)]
+        p3 = part3[_part3_key(config)]
+        rows.append(
+            {
+                "config": asdict(config),
+                "part1_best": p1["best"],
+                "part1_macro_f1": p1["metrics"][p1["best"]]["macro_f1"],
+                "part2_best": p2["best"],
+                "part2_macro_f1": p2["metrics"][p2["best"]]["macro_f1"],
+                "chosen_k": p3["chosen_k"],
+                "part1": p1["metrics"],
+                "part2": p2["metrics"],
+            }
+        )
+    return {
+        "plan": plan_summary(plan),
+        "workers": workers,
+        "threads_per_worker": threads_per_worker,
+        "results": rows,
+    }
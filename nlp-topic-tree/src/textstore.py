@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Iterable, Iterator
+
+import numpy as np
+
+
+class TextColumn:
+    def __init__(self, buffer: np.ndarray, offsets: np.ndarray, index: np.ndarray | None = None):
+        self._buffer = buffer
+        self._offsets = offsets
+        self._index = index
+
+    @classmethod
+    def from_texts(cls, texts: Iterable[str]) -> "TextColumn":
+        chunks: list[bytes] = []
+        lengths: list[int] = []
+        for text in texts:
+            encoded = text.encode("utf-8")
+            chunks.append(encoded)
+            lengths.append(len(encoded))
+        offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        buffer = np.frombuffer(b"".join(chunks), dtype=np.uint8)
+        return cls(buffer, offsets)
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1 if self._index is None else len(self._index)
+
+    def _row(self, i: int) -> int:
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError(f"index {i} out of range for TextColumn of length {len(self)}")
+        return i if self._index is None else int(self._index[i])
+
+    def _bytes(self, row: int, limit: int | None = None) -> bytes:
+        start, stop = int(self._offsets[row]), int(self._offsets[row + 1])
+        if limit is not None:
+            stop = min(stop, start + limit)
+        return self._buffer[start:stop].tobytes()
+
+    def __getitem__(self, key):
+        if isinstance(key, (int, np.integer)):
+            return self._bytes(self._row(int(key))).decode("utf-8")
+        rows = np.arange(len(self))[key] if isinstance(key, slice) else np.asarray(key)
+        if rows.dtype == bool:
+            rows = np.flatnonzero(rows)
+        if self._index is not None:
+            rows = self._index[rows]
+        return TextColumn(self._buffer, self._offsets, rows.astype(np.int64, copy=False))
+
+    def __iter__(self) -> Iterator[str]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def snippet(self, i: int, n_chars: int) -> str:
+        # A UTF-8 character is at most 4 bytes, so 4 * n_chars bytes always cover n_chars characters.
+        return self._bytes(self._row(i), limit=4 * n_chars).decode("utf-8", errors="ignore")[:n_chars]
+
+    @property
+    def nbytes(self) -> int:
+        index_bytes = 0 if self._index is None else self._index.nbytes
+        return int(self._buffer.nbytes + self._offsets.nbytes + index_bytes)
+
+    def compact(self) -> "TextColumn":
+        if self._index is None:
+            return self
+        starts, stops = self._offsets[self._index], self._offsets[self._index + 1]
+        lengths = stops - starts
+        offsets = np.zeros(len(self) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        gather = np.repeat(starts - offsets[:-1], lengths) + np.arange(offsets[-1], dtype=np.int64)
+        return TextColumn(self._buffer[gather], offsets)
+
+    def save(self, path: str | Path):
+        path = Path(path)
+        path.mkdir(parents=True, exist_ok=True)
+        column = self.compact()
+        np.save(path / "buffer.npy", column._buffer)
+        np.save(path / "offsets.npy", column._offsets)
+
+    @classmethod
+    def load(cls, path: str | Path, mmap: bool = True) -> "TextColumn":
+        path = Path(path)
+        mode = "r" if mmap else None
+        return cls(np.load(path / "buffer.npy", mmap_mode=mode), np.load(path / "offsets.npy", mmap_mode=mode))
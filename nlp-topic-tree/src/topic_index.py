@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import numpy as np
+
+
+@dataclass
+class CentroidIndex:
+    # Level l holds every node at depth l in one contiguous (n_nodes, dim) matrix. The children of
+    # node j at level l - 1 are rows offsets[l][j]:offsets[l][j + 1] of centroids[l]; level 0 has [0, k].
+    centroids: list[np.ndarray]
+    offsets: list[np.ndarray]
+    node_ids: list[np.ndarray]
+    meta: dict = field(default_factory=dict)
+
+    @property
+    def depth(self) -> int:
+        return len(self.centroids)
+
+    @property
+    def dim(self) -> int:
+        return int(self.centroids[0].shape[1])
+
+    def route(self, x: np.ndarray, top_n: int = 1) -> tuple[np.ndarray, np.ndarray]:
+        # Paths are ranked level by level: the kept beams are ordered by their parent's rank, then by
+        # the distance at the new level, so rank 0 is always the greedy descent whatever top_n is.
+        # A score sums one squared distance per level; a path that stops at a leaf above the bottom
+        # level counts the leaf's own distance again for each missing level, so scores of paths that
+        # end at different depths stay comparable.
+        x = np.ascontiguousarray(x, dtype=np.float32)
+        n = x.shape[0]
+        d0 = _sq_dists(x, self.centroids[0])
+        beam = min(top_n, d0.shape[1])
+        order = np.argsort(d0, axis=1)[:, :beam]
+        scores = np.take_along_axis(d0, order, axis=1)
+        last = scores.copy()
+        paths = np.full((n, beam, self.depth), -1, dtype=np.int64)
+        paths[:, :, 0] = order
+
+        for level in range(1, self.depth):
+            offsets = self.offsets[level]
+            parents = paths[:, :, level - 1]
+            cand_doc, cand_beam, cand_node, cand_dist = [], [], [], []
+
+            stopped = parents < 0
+            stopped |= ~stopped & (offsets[np.maximum(parents, 0) + 1] == offsets[np.maximum(parents, 0)])
+            doc_idx, beam_idx = np.nonzero(stopped)
+            cand_doc.append(doc_idx)
+            cand_beam.append(beam_idx)
+            cand_node.append(np.full(len(doc_idx), -1, dtype=np.int64))
+            cand_dist.append(last[doc_idx, beam_idx])
+
+            for parent in np.unique(parents[~stopped]):
+                lo, hi = int(offsets[parent]), int(offsets[parent + 1])
+                doc_idx, beam_idx = np.nonzero(parents == parent)
+                dists = _sq_dists(x[doc_idx], self.centroids[level][lo:hi])
+                n_children = hi - lo
+                cand_doc.append(np.repeat(doc_idx, n_children))
+                cand_beam.append(np.repeat(beam_idx, n_children))
+                cand_node.append(np.tile(np.arange(lo, hi, dtype=np.int64), len(doc_idx)))
+                cand_dist.append(dists.ravel())
+
+            doc = np.concatenate(cand_doc)
+            src = np.concatenate(cand_beam)
+            node = np.concatenate(cand_node)
+            dist = np.concatenate(cand_dist)
+
+            order = np.lexsort((dist, src, doc))
+            doc, src, node, dist = doc[order], src[order], node[order], dist[order]
+            starts = np.searchsorted(doc, np.arange(n))
+            rank = np.arange(len(doc)) - starts[doc]
+            keep = rank < beam
+
+            new_paths = np.full_like(paths, -1)
+            new_scores = np.full_like(scores, np.inf)
+            new_last = np.full_like(last, np.inf)
+            slot_doc, slot_rank, slot_src = doc[keep], rank[keep], src[keep]
+            new_paths[slot_doc, slot_rank] = paths[slot_doc, slot_src]
+            new_paths[slot_doc, slot_rank, level] = node[keep]
+            new_scores[slot_doc, slot_rank] = scores[slot_doc, slot_src] + dist[keep]
+            new_last[slot_doc, slot_rank] = dist[keep]
+            paths, scores, last = new_paths, new_scores, new_last
+
+        return paths, scores
+
+    def path_ids(self, paths: np.ndarray) -> np.ndarray:
+        ids = np.full(paths.shape, -1, dtype=np.int64)
+        for level in range(self.depth):
+            rows = paths[..., level]
+            valid = rows >= 0
+            ids[..., level][valid] = self.node_ids[level][rows[valid]]
+        return ids
+
+    def save(self, path: str | Path):
+        path = Path(path)
+        arrays = {}
+        for level in range(self.depth):
+            arrays[f"centroids_{level}"] = self.centroids[level]
+            arrays[f"offsets_{level}"] = self.offsets[level]
+            arrays[f"node_ids_{level}"] = self.node_ids[level]
+        np.savez(path.with_suffix(".npz"), **arrays)
+        payload = {
+            "depth": self.depth,
+            "dim": self.dim,
+            "nodes_per_level": [int(c.shape[0]) for c in self.centroids],
+            **self.meta,
+        }
+        path.with_suffix(".json").write_text(json.dumps(payload, indent=2), encoding="utf-8")
+
+    @classmethod
+    def load(cls, path: str | Path) -> "CentroidIndex":
+        path = Path(path)
+        meta = json.loads(path.with_suffix(".json").read_text(encoding="utf-8"))
+        with np.load(path.with_suffix(".npz")) as arrays:
+            depth = meta.pop("depth")
+            centroids = [arrays[f"centroids_{level}"] for level in range(depth)]
+            offsets = [arrays[f"offsets_{level}"] for level in range(depth)]
+            node_ids = [arrays[f"node_ids_{level}"] for level in range(depth)]
+        meta.pop("dim", None)
+        meta.pop("nodes_per_level", None)
+        return cls(centroids=centroids, offsets=offsets, node_ids=node_ids, meta=meta)
+
+
+def _sq_dists(x: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+    c = centroids.astype(np.float32, copy=False)
+    d = (x * x).sum(axis=1)[:, None] - 2.0 * (x @ c.T) + (c * c).sum(axis=1)[None, :]
+    return np.maximum(d, 0.0)
+
+
+def build_topic_index(top_km, sub_models: dict[int, object], meta: dict | None = None) -> CentroidIndex:
+    k = top_km.cluster_centers_.shape[0]
+    dim = top_km.cluster_centers_.shape[1]
+    child_counts = [sub_models[cid].n_clusters if cid in sub_models else 0 for cid in range(k)]
+    sub_centroids = [sub_models[cid].cluster_centers_ for cid in range(k) if cid in sub_models]
+    offsets = np.zeros(k + 1, dtype=np.int64)
+    np.cumsum(child_counts, out=offsets[1:])
+    return CentroidIndex(
+        centroids=[
+            np.ascontiguousarray(top_km.cluster_centers_, dtype=np.float32),
+            np.ascontiguousarray(
+                np.vstack(sub_centroids) if sub_centroids else np.empty((0, dim)), dtype=np.float32
+            ),
+        ],
+        offsets=[np.array([0, k], dtype=np.int64), offsets],
+        node_ids=[
+            np.arange(k, dtype=np.int32),
+            np.concatenate([np.arange(n, dtype=np.int32) for n in child_counts]) if k else np.empty(0, np.int32),
+        ],
+        meta=meta or {},
+    )
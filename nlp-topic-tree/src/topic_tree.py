@@ -1,14 +1,128 @@
 from __future__ import annotations
 
+import itertools
+import json
+from pathlib import Path
+from typing import Iterable, Iterator
 
-def render_topic_tree(top_clusters: list[dict], sub_clusters: list[dict]) -> str:
-    lines = ["Topic Tree", "========="]
-    sub_map = {}
-    for item in sub_clusters:
-        sub_map.setdefault(item["parent_cluster_id"], []).append(item)
-
-    for cluster in sorted(top_clusters, key=lambda x: x["cluster_id"]):
-        lines.append(f"- [{cluster['cluster_id']}] {cluster['label']} (n={cluster['size']})")
-        for sub in sorted(sub_map.get(cluster["cluster_id"], []), key=lambda x: x["subcluster_id"]):
-            lines.append(f"  - [{cluster['cluster_id']}.{sub['subcluster_id']}] {sub['label']} (n={sub['size']})")
-    return "\n".join(lines)
+import numpy as np
+
+
+def _children_by_parent(sub_clusters: list[dict]) -> dict[int, list[dict]]:
+    ordered = sorted(sub_clusters, key=lambda x: (x["parent_cluster_id"], x["subcluster_id"]))
+    return {pid: list(group) for pid, group in itertools.groupby(ordered, key=lambda x: x["parent_cluster_id"])}
+
+
+def _node_line(node: dict, markdown: bool = False) -> str:
+    if "parent_cluster_id" in node:
+        return f"  - [{node['parent_cluster_id']}.{node['subcluster_id']}] {node['label']} (n={node['size']})"
+    if markdown:
+        return f"- **[{node['cluster_id']}] {node['label']}** (n={node['size']})"
+    return f"- [{node['cluster_id']}] {node['label']} (n={node['size']})"
+
+
+def _by_size(nodes: list[dict]) -> list[dict]:
+    return sorted(nodes, key=lambda x: -x["size"])
+
+
+def iter_tree_nodes(top_clusters: list[dict], sub_clusters: list[dict]) -> Iterator[dict]:
+    # Largest first, so any head of the stream (truncated views, render_tree_from_jsonl) is a true top-N.
+    children = _children_by_parent(sub_clusters)
+    for cluster in _by_size(sorted(top_clusters, key=lambda x: x["cluster_id"])):
+        yield cluster
+        yield from _by_size(children.get(cluster["cluster_id"], []))
+
+
+def iter_tree_lines(
+    nodes: Iterable[dict],
+    max_top: int | None = None,
+    max_children: int | None = None,
+    markdown: bool = False,
+) -> Iterator[str]:
+    if markdown:
+        yield "# Topic Tree"
+        yield ""
+    else:
+        yield "Topic Tree"
+        yield "========="
+    n_top = n_children = 0
+    for node in nodes:
+        if "parent_cluster_id" not in node:
+            n_top += 1
+            n_children = 0
+            if max_top is not None and n_top > max_top:
+                yield "- ..."
+                return
+            yield _node_line(node, markdown)
+            continue
+        n_children += 1
+        if max_children is not None and n_children > max_children:
+            if n_children == max_children + 1:
+                yield "  - ..."
+            continue
+        yield _node_line(node, markdown)
+
+
+def render_topic_tree(
+    top_clusters: list[dict],
+    sub_clusters: list[dict],
+    max_top: int | None = None,
+    max_children: int | None = None,
+) -> str:
+    return "\n".join(iter_tree_lines(iter_tree_nodes(top_clusters, sub_clusters), max_top, max_children))
+
+
+def iter_tree_jsonl(path: Path) -> Iterator[dict]:
+    with path.open(encoding="utf-8") as f:
+        for line in f:
+            yield json.loads(line)
+
+
+def render_tree_from_jsonl(path: Path, max_top: int | None = None, max_children: int | None = None) -> str:
+    return "\n".join(iter_tree_lines(iter_tree_jsonl(path), max_top, max_children))
+
+
+def _write_lines(path: Path, lines: Iterable[str]):
+    with path.open("w", encoding="utf-8") as f:
+        for line in lines:
+            f.write(line)
+            f.write("\n")
+
+
+def _membership(doc_rows: np.ndarray, n_nodes: int) -> tuple[np.ndarray, np.ndarray]:
+    valid = np.flatnonzero(doc_rows >= 0)
+    rows = doc_rows[valid]
+    order = valid[np.argsort(rows, kind="stable")]
+    offsets = np.zeros(n_nodes + 1, dtype=np.int64)
+    np.cumsum(np.bincount(rows, minlength=n_nodes), out=offsets[1:])
+    return order.astype(np.int64), offsets
+
+
+def export_topic_tree(
+    out_dir: Path,
+    top_clusters: list[dict],
+    sub_clusters: list[dict],
+    doc_rows: list[np.ndarray] | None = None,
+):
+    _write_lines(out_dir / "topic_tree.txt", iter_tree_lines(iter_tree_nodes(top_clusters, sub_clusters)))
+    _write_lines(out_dir / "topic_tree.md", iter_tree_lines(iter_tree_nodes(top_clusters, sub_clusters), markdown=True))
+    _write_lines(out_dir / "topic_tree.jsonl", (json.dumps(n) for n in iter_tree_nodes(top_clusters, sub_clusters)))
+
+    levels = [sorted(top_clusters, key=lambda x: x["cluster_id"])]
+    levels.append([sub for group in _children_by_parent(sub_clusters).values() for sub in group])
+    nodes = levels[0] + levels[1]
+    columns = {
+        "level": np.concatenate([np.full(len(level_nodes), level, dtype=np.int8) for level, level_nodes in enumerate(levels)]),
+        "row": np.concatenate([np.arange(len(level_nodes), dtype=np.int64) for level_nodes in levels]),
+        "cluster_id": np.array([n.get("parent_cluster_id", n.get("cluster_id")) for n in nodes], dtype=np.int64),
+        "subcluster_id": np.array([n.get("subcluster_id", -1) for n in nodes], dtype=np.int64),
+        "size": np.array([n["size"] for n in nodes], dtype=np.int64),
+        "label": np.array([n["label"] for n in nodes], dtype=str),
+    }
+    np.savez(out_dir / "topic_nodes.npz", **columns)
+
+    if doc_rows is not None:
+        members = {}
+        for level, rows in enumerate(doc_rows):
+            members[f"order_{level}"], members[f"offsets_{level}"] = _membership(rows, len(levels[level]))
+        np.savez(out_dir / "topic_members.npz", **members)
@@ -0,0 +1,50 @@
+import itertools
+
+import numpy as np
+
+from src.dedup import dedup_texts, minhash_signatures, normalize_text
+
+
+def _edit(words, rng, fraction):
+    words = list(words)
+    for i in rng.choice(len(words), size=int(len(words) * fraction), replace=False):
+        words[i] = f"edit{rng.integers(1_000_000)}"
+    return words
+
+
+def _chain_corpus(seed=0, n_chains=20, chain_length=6, fraction=0.04):
+    rng = np.random.default_rng(seed)
+    texts = []
+    for _ in range(n_chains):
+        words = [f"w{rng.integers(50_000)}" for _ in range(150)]
+        for _ in range(chain_length):
+            texts.append(" ".join(words))
+            words = _edit(words, rng, fraction)
+    return texts
+
+
+def _agreement(texts, i, j, seed=42):
+    sig = minhash_signatures([normalize_text(texts[i]), normalize_text(texts[j])], seed=seed)
+    return float(np.mean(sig[0] == sig[1]))
+
+
+def test_near_groups_do_not_chain():
+    texts = _chain_corpus()
+    threshold = 0.8
+    result = dedup_texts(texts, mode="near", threshold=threshold)
+    assert result.stats["n_near_duplicates"] > 0
+    for group in range(len(result.representatives)):
+        members = np.flatnonzero(result.inverse == group)
+        rep = int(result.representatives[group])
+        for member in members:
+            assert _agreement(texts, rep, member) >= threshold
+        for i, j in itertools.combinations(members, 2):
+            assert _agreement(texts, i, j) >= 2 * threshold - 1
+
+
+def test_exact_duplicates_collapse():
+    texts = ["Hello, world!", "hello world", "something else entirely", "HELLO   WORLD"]
+    result = dedup_texts(texts, mode="exact")
+    assert result.stats["n_unique"] == 2
+    assert list(result.weights) == [3, 1]
+    assert list(result.fan_out(np.array([10, 20]))) == [10, 10, 20, 10]
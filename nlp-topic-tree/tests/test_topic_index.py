@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+from sklearn.cluster import KMeans
+
+from src.topic_index import _sq_dists, build_topic_index
+
+
+def _greedy_route(index, x):
+    paths = np.full((x.shape[0], index.depth), -1, dtype=np.int64)
+    scores = np.zeros(x.shape[0])
+    for i in range(x.shape[0]):
+        lo, hi, last = 0, index.centroids[0].shape[0], 0.0
+        for level in range(index.depth):
+            if hi > lo:
+                dists = _sq_dists(x[i : i + 1], index.centroids[level][lo:hi])[0]
+                row = lo + int(np.argmin(dists))
+                paths[i, level] = row
+                last = dists[row - lo]
+                if level + 1 < index.depth:
+                    lo, hi = int(index.offsets[level + 1][row]), int(index.offsets[level + 1][row + 1])
+            scores[i] += last
+    return paths, scores
+
+
+@pytest.fixture(scope="module")
+def index_and_points():
+    rng = np.random.default_rng(0)
+    x = rng.normal(size=(600, 8)).astype(np.float32)
+    top = KMeans(n_clusters=6, random_state=0, n_init=3).fit(x)
+    subs = {cid: KMeans(n_clusters=3, random_state=0, n_init=3).fit(x[top.labels_ == cid]) for cid in (0, 3)}
+    points = (rng.normal(size=(3_000, 8)) * 1.3).astype(np.float32)
+    return build_topic_index(top, subs), points
+
+
+def test_route_matches_greedy_descent(index_and_points):
+    index, x = index_and_points
+    paths, scores = index.route(x, top_n=1)
+    greedy_paths, greedy_scores = _greedy_route(index, x)
+    np.testing.assert_array_equal(paths[:, 0], greedy_paths)
+    np.testing.assert_allclose(scores[:, 0], greedy_scores, rtol=1e-4)
+
+
+@pytest.mark.parametrize("top_n", [2, 3, 6])
+def test_best_route_does_not_depend_on_top_n(index_and_points, top_n):
+    index, x = index_and_points
+    single, single_scores = index.route(x, top_n=1)
+    paths, scores = index.route(x, top_n=top_n)
+    np.testing.assert_array_equal(paths[:, 0], single[:, 0])
+    np.testing.assert_allclose(scores[:, 0], single_scores[:, 0])
+
+
+def test_scores_pad_childless_paths_with_leaf_distance(index_and_points):
+    index, x = index_and_points
+    paths, scores = index.route(x[:200], top_n=4)
+    for i in range(paths.shape[0]):
+        for b in range(paths.shape[1]):
+            root, child = paths[i, b]
+            expected = _sq_dists(x[i : i + 1], index.centroids[0][root : root + 1])[0, 0]
+            leaf = expected if child < 0 else _sq_dists(x[i : i + 1], index.centroids[1][child : child + 1])[0, 0]
+            assert scores[i, b] == pytest.approx(expected + leaf, rel=1e-4)